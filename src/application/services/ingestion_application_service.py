@@ -6,6 +6,7 @@ the IngestionServiceInterface contract.
 """
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Callable
 
@@ -122,37 +123,19 @@ class IngestionApplicationService(IngestionServiceInterface):
 
         return decision
 
-    def validate_prerequisites(self) -> ValidationResult:
-        """Validate all prerequisites for ingestion."""
-        result = ValidationResult(is_valid=True)
+    def validate_prerequisites(self, parallel: bool = True) -> ValidationResult:
+        """
+        Validate all prerequisites for ingestion.
 
-        # Check Weaviate connectivity
-        result.checks_performed.append("weaviate_connectivity")
-        try:
-            if not self.client.is_connected():
-                result.add_error(
-                    "Cannot connect to Weaviate", "weaviate_connectivity"
-                )
-                return result
-            result.add_success("Weaviate is reachable", "weaviate_connectivity")
-        except Exception as e:
-            result.add_error(
-                f"Connection failed: {str(e)}", "weaviate_connectivity"
-            )
-            return result
+        The config and data-file checks only touch local disk, so by
+        default they run in a worker thread while the Weaviate checks
+        are in flight. Results are reported in the same order either way.
 
-        # Ensure schema exists
-        result.checks_performed.append("schema_validation")
-        try:
-            self.client.ensure_schema()
-            result.add_success("Schema is ready", "schema_validation")
-        except Exception as e:
-            result.add_error(
-                f"Schema setup failed: {str(e)}", "schema_validation"
-            )
-            return result
-
-        # Validate config and data files via domain service
+        Args:
+            parallel: Run the local checks concurrently with the Weaviate
+                checks; False runs them afterwards
+        """
+        result = ValidationResult(is_valid=True)
         required_files = [
             "occupations_en.csv",
             "skills_en.csv",
@@ -160,17 +143,60 @@ class IngestionApplicationService(IngestionServiceInterface):
             "broaderRelationsOccPillar_en.csv",
             "occupationSkillRelations_en.csv",
         ]
-        domain_result = self.ingestion_domain_service.validate_ingestion_prerequisites(
-            self.config, required_files
-        )
-        result.checks_performed.extend(domain_result.checks_performed)
-        result.errors.extend(domain_result.errors)
-        result.warnings.extend(domain_result.warnings)
-        result.details.update(domain_result.details)
-        if domain_result.errors:
-            result.is_valid = False
+        executor: Optional[ThreadPoolExecutor] = None
+        domain_future: Optional[Future] = None
+        if parallel:
+            executor = ThreadPoolExecutor(max_workers=1)
+            domain_future = executor.submit(
+                self.ingestion_domain_service.validate_ingestion_prerequisites,
+                self.config, required_files
+            )
 
-        return result
+        try:
+            # Check Weaviate connectivity
+            result.checks_performed.append("weaviate_connectivity")
+            try:
+                if not self.client.is_connected():
+                    result.add_error(
+                        "Cannot connect to Weaviate", "weaviate_connectivity"
+                    )
+                    return result
+                result.add_success("Weaviate is reachable", "weaviate_connectivity")
+            except Exception as e:
+                result.add_error(
+                    f"Connection failed: {str(e)}", "weaviate_connectivity"
+                )
+                return result
+
+            # Ensure schema exists
+            result.checks_performed.append("schema_validation")
+            try:
+                self.client.ensure_schema()
+                result.add_success("Schema is ready", "schema_validation")
+            except Exception as e:
+                result.add_error(
+                    f"Schema setup failed: {str(e)}", "schema_validation"
+                )
+                return result
+
+            # Validate config and data files via domain service
+            if domain_future is not None:
+                domain_result = domain_future.result()
+            else:
+                domain_result = self.ingestion_domain_service.validate_ingestion_prerequisites(
+                    self.config, required_files
+                )
+            result.checks_performed.extend(domain_result.checks_performed)
+            result.errors.extend(domain_result.errors)
+            result.warnings.extend(domain_result.warnings)
+            result.details.update(domain_result.details)
+            if domain_result.errors:
+                result.is_valid = False
+
+            return result
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
 
     def run_ingestion(
         self,
@@ -178,7 +204,7 @@ class IngestionApplicationService(IngestionServiceInterface):
     ) -> IngestionResult:
         """Run the ingestion process."""
         start_time = datetime.utcnow()
-        total_steps = 12  # schema + 5 entities + 6 relations
+        total_steps = 13  # schema + 5 entities + UUID prefetch + 6 relations
 
         # Mark ingestion as in-progress
         try:
@@ -192,6 +218,7 @@ class IngestionApplicationService(IngestionServiceInterface):
         except Exception as e:
             logger.warning(f"Failed to set initial metadata: {e}")
 
+        step_timings: Dict[str, float] = {}
         try:
             if self.ingestor:
                 self.ingestor.run_simple_ingestion()
@@ -206,8 +233,10 @@ class IngestionApplicationService(IngestionServiceInterface):
                         data_dir=self.config.data_dir,
                         batch_size=self.config.batch_size,
                         progress_callback=progress_callback,
+                        force=self.config.force_reingest,
                     )
                     orchestrator.run_complete_ingestion()
+                    step_timings = orchestrator.step_timings
                 except ImportError:
                     raise RuntimeError(
                         "No ingestor provided and IngestionOrchestrator not available"
@@ -221,6 +250,7 @@ class IngestionApplicationService(IngestionServiceInterface):
                 details={
                     "completed_at": end_time.isoformat(),
                     "started_at": start_time.isoformat(),
+                    "step_timings": step_timings,
                 }
             )
 
@@ -340,7 +340,7 @@ class IngestionConfig:
     force_reingest: bool = False
     
     # System settings
-    batch_size: int = 100
+    batch_size: int = 1000
     data_dir: str = ""
     non_interactive: bool = False
     docker_env: bool = False
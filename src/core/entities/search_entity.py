@@ -6,7 +6,7 @@ results, and related metadata.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence
 from datetime import datetime
 
 
@@ -55,7 +55,7 @@ class SearchResult:
     score: float = 0.0
     type: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
-    highlights: List[str] = field(default_factory=list)
+    highlights: Sequence[str] = ()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary representation."""
@@ -10,9 +10,7 @@ from typing import Optional, Dict, Any
 
 # Local imports
 from src.infrastructure.database.weaviate.weaviate_client import WeaviateClient
-from src.infrastructure.external.embedding_utils import ESCOEmbedding
 from src.shared.logging.structured_logger import configure_logging
-from src.weaviate_semantic_search import VaritySemanticSearch
 
 # ESCO v1.2.0 (English) – CSV classification import for Weaviate
 # Oz Levi
@@ -21,6 +19,12 @@ from src.weaviate_semantic_search import VaritySemanticSearch
 # Setup logging
 logger = configure_logging()
 
+
+def _tail(uri):
+    """Return the last path segment of a URI (the ESCO UUID)."""
+    return uri.rpartition("/")[2]
+
+
 class BaseIngestor(ABC):
     """Base class for ESCO data ingestion"""
     
@@ -116,6 +120,8 @@ class WeaviateIngestor(BaseIngestor):
         )
         super().__init__(config_path, profile)
         self.client = client or WeaviateClient(url=os.getenv("WEAVIATE_URL", "http://weaviate:8080"))
+        # Imported here so --help and module import don't load torch
+        from src.infrastructure.external.embedding_utils import ESCOEmbedding
         self.embedding_util = ESCOEmbedding()
 
     def _get_default_config_path(self):
@@ -340,7 +346,7 @@ class WeaviateIngestor(BaseIngestor):
                         "iscoLevel": record.get("iscoLevel", ""),
                     }
                     isco_group_data = {k: v for k, v in isco_group_data.items() if v is not None and v != ""}
-                    uuid = isco_group_data["uri"].split("/")[-1]
+                    uuid = _tail(isco_group_data["uri"])
                     objects.append(isco_group_data)
                     uuids.append(uuid)
                 except Exception as e:
@@ -445,17 +451,22 @@ class WeaviateIngestor(BaseIngestor):
         skill_uuids = self._prefetch_uuids("Skill")
 
         df = pd.read_csv(file_path)
+        if 'occupationUri' not in df.columns or 'skillUri' not in df.columns:
+            logger.warning("Required columns not found in occupation-skill relations file – skipping.")
+            return
         if len(df) == 0:
             logger.warning("No occupation-skill relations found – skipping.")
             return
+        if 'relationType' not in df.columns:
+            df['relationType'] = 'related'
 
         refs_batch = []
         skipped = 0
-        for record in tqdm(df.to_dict("records"), desc="Preparing Occupation-Skill Relations", unit="rel"):
+        rows = df[['occupationUri', 'skillUri', 'relationType']].itertuples(index=False, name=None)
+        for occupation_uri, skill_uri, relation_type in tqdm(rows, total=len(df), desc="Preparing Occupation-Skill Relations", unit="rel", mininterval=1.0, miniters=10000):
             try:
-                occupation_uuid = record['occupationUri'].split('/')[-1]
-                skill_uuid = record['skillUri'].split('/')[-1]
-                relation_type = record.get('relationType', 'related')
+                occupation_uuid = _tail(occupation_uri)
+                skill_uuid = _tail(skill_uri)
 
                 if occupation_uuid not in occupation_uuids or skill_uuid not in skill_uuids:
                     skipped += 1
@@ -500,10 +511,11 @@ class WeaviateIngestor(BaseIngestor):
 
         refs_batch = []
         skipped = 0
-        for record in tqdm(df.to_dict("records"), desc="Preparing Hierarchical Relations", unit="rel"):
+        rows = df[['broaderUri', 'narrowerUri']].itertuples(index=False, name=None)
+        for broader_uri, narrower_uri in tqdm(rows, total=len(df), desc="Preparing Hierarchical Relations", unit="rel", mininterval=1.0, miniters=10000):
             try:
-                broader_uuid = record['broaderUri'].split('/')[-1]
-                narrower_uuid = record['narrowerUri'].split('/')[-1]
+                broader_uuid = _tail(broader_uri)
+                narrower_uuid = _tail(narrower_uri)
                 if broader_uuid not in occupation_uuids or narrower_uuid not in occupation_uuids:
                     skipped += 1
                     continue
@@ -526,7 +538,7 @@ class WeaviateIngestor(BaseIngestor):
 
         try:
             # Pre-load ISCO groups keyed by code
-            isco_groups = self.client.get_objects(class_name="ISCOGroup")
+            isco_groups = self.client.get_objects(class_name="ISCOGroup", fields=["code"])
             isco_by_code = {}
             for g in isco_groups:
                 code = g.get("code")
@@ -536,7 +548,7 @@ class WeaviateIngestor(BaseIngestor):
             occupations = self.client.get_objects(class_name="Occupation")
 
             refs_batch = []
-            for occupation in tqdm(occupations, desc="Preparing ISCO Group Relations", unit="occ"):
+            for occupation in tqdm(occupations, desc="Preparing ISCO Group Relations", unit="occ", mininterval=1.0, miniters=10000):
                 isco_code = occupation.get("iscoCode")
                 if not isco_code or isco_code not in isco_by_code:
                     continue
@@ -648,10 +660,11 @@ class WeaviateIngestor(BaseIngestor):
 
         refs_batch = []
         skipped = 0
-        for record in tqdm(df.to_dict("records"), desc="Preparing Skill Collection Relations", unit="rel"):
+        rows = df[['conceptSchemeUri', 'skillUri']].itertuples(index=False, name=None)
+        for collection_uri, skill_uri in tqdm(rows, total=len(df), desc="Preparing Skill Collection Relations", unit="rel", mininterval=1.0, miniters=10000):
             try:
-                collection_uuid = record['conceptSchemeUri'].split('/')[-1]
-                skill_uuid = record['skillUri'].split('/')[-1]
+                collection_uuid = _tail(collection_uri)
+                skill_uuid = _tail(skill_uri)
                 if collection_uuid not in collection_uuids or skill_uuid not in skill_uuids:
                     skipped += 1
                     continue
@@ -678,6 +691,9 @@ class WeaviateIngestor(BaseIngestor):
         logger.info(f"Creating skill-skill relations from {file_path}")
 
         df = pd.read_csv(file_path)
+        if 'skillUri' not in df.columns or 'relatedSkillUri' not in df.columns:
+            logger.warning("Required columns not found in skill-skill relations file – skipping.")
+            return
         if len(df) == 0:
             logger.warning("No skill-skill relations found – skipping.")
             return
@@ -686,10 +702,11 @@ class WeaviateIngestor(BaseIngestor):
 
         refs_batch = []
         skipped = 0
-        for record in tqdm(df.to_dict("records"), desc="Preparing Skill-Skill Relations", unit="rel"):
+        rows = df[['skillUri', 'relatedSkillUri']].itertuples(index=False, name=None)
+        for skill_uri, related_uri in tqdm(rows, total=len(df), desc="Preparing Skill-Skill Relations", unit="rel", mininterval=1.0, miniters=10000):
             try:
-                skill_uuid = record['skillUri'].split('/')[-1]
-                related_uuid = record['relatedSkillUri'].split('/')[-1]
+                skill_uuid = _tail(skill_uri)
+                related_uuid = _tail(related_uri)
                 if skill_uuid not in skill_uuids or related_uuid not in skill_uuids:
                     skipped += 1
                     continue
@@ -729,10 +746,11 @@ class WeaviateIngestor(BaseIngestor):
 
         refs_batch = []
         skipped = 0
-        for record in tqdm(df.to_dict("records"), desc="Preparing Broader Skill Relations", unit="rel"):
+        rows = df[['conceptUri', 'broaderUri']].itertuples(index=False, name=None)
+        for skill_uri, broader_uri in tqdm(rows, total=len(df), desc="Preparing Broader Skill Relations", unit="rel", mininterval=1.0, miniters=10000):
             try:
-                skill_uuid = record['conceptUri'].split('/')[-1]
-                broader_uuid = record['broaderUri'].split('/')[-1]
+                skill_uuid = _tail(skill_uri)
+                broader_uuid = _tail(broader_uri)
                 if skill_uuid not in skill_uuids or broader_uuid not in skill_uuids:
                     skipped += 1
                     continue
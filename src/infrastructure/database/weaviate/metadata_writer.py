@@ -0,0 +1,80 @@
+"""
+Buffered writer for the ingestion Metadata object.
+
+Ingestion status lives in a single Metadata object, so only the newest
+write matters. This module coalesces bursts of status updates into one
+Weaviate write per flush window instead of one HTTP call per update.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionMetadataWriter:
+    """
+    Coalesce ingestion metadata writes and flush them after a short delay.
+
+    write() only records the newest properties and arms a timer; when the
+    timer fires (or flush() is called) the pending properties are written
+    with a single call to ``write_fn``. Flushes are serialized so a slow
+    older write can never overwrite a newer one.
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[Dict[str, Any]], None],
+        flush_ms: float = 50.0
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            write_fn: Callable that persists one set of Metadata properties
+            flush_ms: Delay before pending properties are written; 0 writes
+                synchronously on every call
+        """
+        self._write_fn = write_fn
+        self._flush_delay = flush_ms / 1000.0
+        self._pending: Optional[Dict[str, Any]] = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def write(self, props: Dict[str, Any]) -> None:
+        """
+        Record the newest Metadata properties, replacing any pending ones.
+
+        Args:
+            props: Metadata object properties
+        """
+        if self._flush_delay <= 0:
+            with self._lock:
+                self._pending = props
+            self.flush()
+            return
+
+        with self._lock:
+            self._pending = props
+            if self._timer is None:
+                self._timer = threading.Timer(self._flush_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write pending properties now, if there are any."""
+        with self._write_lock:
+            with self._lock:
+                props = self._pending
+                self._pending = None
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            if props is None:
+                return
+            try:
+                self._write_fn(props)
+            except Exception as e:
+                logger.warning(f"Failed to flush ingestion metadata: {e}")
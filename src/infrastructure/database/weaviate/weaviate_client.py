@@ -5,17 +5,25 @@ This module provides a client for interacting with Weaviate,
 handling connections and basic operations.
 """
 
+import asyncio
+import functools
 import json
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Iterator, Optional, List, Set, Tuple, TypeVar
+from uuid import uuid4
 
 import yaml
 import weaviate
 from weaviate import Client
+from weaviate.exceptions import UnexpectedStatusCodeException
 from weaviate.util import generate_uuid5
 
+from .metadata_writer import IngestionMetadataWriter
 from ....core.interfaces import ClientInterface
 from ....core.entities import (
     Document,
@@ -25,6 +33,29 @@ from ....core.entities import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Pre-rendered GraphQL for hot read paths, sent via query.raw() to skip
+# the fluent builder on every call.
+_AGGREGATE_COUNT_TPL = "{ Aggregate { %s { meta { count } } } }"
+_UUID_PAGE_TPL = "{ Get { %s(limit: %d%s) { _additional { id } } } }"
+
+# Use the LibYAML-backed loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_CACHE: Dict[str, Tuple[float, Any]] = {}
+
+
+def _load_yaml(path: str) -> Any:
+    """Parse a YAML file, reusing the cached result until its mtime changes."""
+    mtime = os.stat(path).st_mtime
+    cached = _YAML_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    _YAML_CACHE[path] = (mtime, data)
+    return data
+
 
 class _RepositoryProxy:
     """Lightweight repository wrapper returned by get_repository()."""
@@ -35,12 +66,7 @@ class _RepositoryProxy:
 
     def count_objects(self) -> int:
         """Return the total number of objects in the class."""
-        result = (
-            self._client.query
-            .aggregate(self._class_name)
-            .with_meta_count()
-            .do()
-        )
+        result = self._client.query.raw(_AGGREGATE_COUNT_TPL % self._class_name)
         return result["data"]["Aggregate"][self._class_name][0]["meta"]["count"]
 
 
@@ -58,7 +84,9 @@ class WeaviateClient(ClientInterface):
         url: str,
         auth_client_secret: Optional[weaviate.AuthApiKey] = None,
         timeout_config: Optional[tuple] = None,
-        additional_headers: Optional[Dict[str, str]] = None
+        additional_headers: Optional[Dict[str, str]] = None,
+        coalesce_window_ms: float = 0.0,
+        max_coalesced: int = 256
     ):
         """
         Initialize the client.
@@ -68,40 +96,119 @@ class WeaviateClient(ClientInterface):
             auth_client_secret: Optional authentication credentials
             timeout_config: Optional timeout configuration
             additional_headers: Optional additional headers
+            coalesce_window_ms: If > 0, concurrent create_object calls made
+                within this window are submitted together as one batch
+            max_coalesced: Flush a coalesced batch early once it holds
+                this many objects
         """
+        additional_config = None
+        if os.getenv("WEAVIATE_TRANSPORT", "rest").lower() == "grpc":
+            # The v3 client routes eligible Get queries over gRPC when a
+            # port is configured; batch imports still use REST.
+            additional_config = weaviate.Config(
+                grpc_port_experimental=int(os.getenv("WEAVIATE_GRPC_PORT", "50051")),
+            )
         self.client = Client(
             url=url,
             auth_client_secret=auth_client_secret,
-            timeout_config=timeout_config or (5, 60),
-            additional_headers=additional_headers
+            timeout_config=timeout_config or (5, 120),
+            additional_headers=additional_headers,
+            additional_config=additional_config
+        )
+        # Configure the shared batcher once: dynamic sizing with several
+        # worker threads submitting in parallel instead of one serial stream.
+        self.client.batch.configure(
+            batch_size=int(os.getenv("WEAVIATE_BATCH_SIZE", "1000")),
+            dynamic=True,
+            num_workers=int(os.getenv("WEAVIATE_BATCH_WORKERS", "4")),
+            timeout_retries=3,
+            connection_error_retries=3,
+            callback=self._batch_error_callback,
+        )
+        self._coalesce_window = coalesce_window_ms / 1000.0
+        self._max_coalesced = max_coalesced
+        self._pending_creates: List[tuple] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Running flush tasks; the loop only keeps weak references to tasks
+        self._flush_tasks: Set[asyncio.Task] = set()
+        # Per-object errors of the coalesced batch being flushed, keyed by
+        # object ID; only set while that flush holds _batch_lock
+        self._create_errors: Optional[Dict[str, Any]] = None
+        self._last_connected_at = float("-inf")
+        self._schema_cache_ttl = float(os.getenv("SCHEMA_CACHE_TTL", "300"))
+        self._schema_cache: Dict[str, Tuple[float, List[str]]] = {}
+        self._schema_lock = threading.Lock()
+        # When ensure_schema last saw every ESCO class in place; trusted
+        # for SCHEMA_CACHE_TTL since other clients may drop classes
+        self._schema_verified_at = float("-inf")
+        # The v3 client owns a single Batch object; concurrent `with batch`
+        # blocks from different threads would interleave its buffers.
+        self._batch_lock = threading.Lock()
+        # Bounds how many blocking calls the async methods run at once
+        self._async_limit = asyncio.Semaphore(
+            int(os.getenv("WEAVIATE_CONCURRENCY", "32"))
+        )
+        self._metadata_writer = IngestionMetadataWriter(
+            self._write_ingestion_metadata,
+            flush_ms=float(os.getenv("METADATA_FLUSH_MS", "50")),
         )
 
-    @staticmethod
-    def _batch_error_callback(results: Optional[List[Dict[str, Any]]]) -> None:
+    def _batch_error_callback(self, results: Optional[List[Dict[str, Any]]]) -> None:
         """Log errors from batch operations.
 
         The v3 client passes a list of result dicts when the batch flushes.
-        Each dict has a ``result`` key that may contain ``errors``.
+        Each dict has a ``result`` key that may contain ``errors``. While
+        coalesced creates are flushed, object errors are also recorded by
+        ID so each caller's future can fail.
         """
         if results is None:
             return
+        create_errors = self._create_errors
         for item in results:
             if isinstance(item, dict):
                 errors = item.get("result", {}).get("errors")
                 if errors:
                     logger.error("Batch operation error: %s", errors)
+                    if create_errors is not None and item.get("id"):
+                        create_errors[item["id"]] = errors
+
+    @staticmethod
+    def _object_uuid(class_name: str, obj: Dict[str, Any]) -> str:
+        """Derive a deterministic UUID for an object from its stable key.
+
+        Hashing the concept URI (namespaced by class) keeps IDs stable when
+        descriptive text changes and avoids serialising the whole object.
+        Objects without a ``uri`` fall back to hashing the full dict.
+        """
+        uri = obj.get("uri")
+        if uri:
+            return generate_uuid5(uri, class_name)
+        return generate_uuid5(obj)
 
     # ------------------------------------------------------------------ #
     # Connection helpers
     # ------------------------------------------------------------------ #
 
+    _CONNECTED_TTL_SECONDS = 5.0
+
     def is_connected(self) -> bool:
-        """Check if the client is connected to Weaviate."""
-        try:
-            self.client.schema.get()
+        """Check if the client is connected to Weaviate.
+
+        A successful probe is trusted for ``_CONNECTED_TTL_SECONDS`` so
+        callers polling liveness don't issue a round trip every time.
+        Failures are never cached.
+        """
+        now = time.monotonic()
+        if now - self._last_connected_at < self._CONNECTED_TTL_SECONDS:
             return True
+        try:
+            # /v1/.well-known/ready has an empty body, unlike the schema
+            if not self.client.is_ready():
+                return False
         except Exception:
             return False
+        self._last_connected_at = now
+        return True
 
     # ------------------------------------------------------------------ #
     # Synchronous methods used by legacy modules
@@ -127,10 +234,7 @@ class WeaviateClient(ClientInterface):
         uuids: Optional[List[Optional[str]]] = None
     ) -> None:
         """Insert multiple objects in a single Weaviate batch call."""
-        with self.client.batch(
-            batch_size=100,
-            callback=self._batch_error_callback,
-        ) as batch:
+        with self._batch_lock, self.client.batch as batch:
             for idx, props in enumerate(objects):
                 uid = uuids[idx] if uuids and idx < len(uuids) else None
                 batch.add_data_object(
@@ -149,10 +253,7 @@ class WeaviateClient(ClientInterface):
         Each entry in *references* must be a dict with keys:
         from_class, from_uuid, ref_property, to_class, to_uuid.
         """
-        with self.client.batch(
-            batch_size=100,
-            callback=self._batch_error_callback,
-        ) as batch:
+        with self._batch_lock, self.client.batch as batch:
             for ref in references:
                 batch.add_reference(
                     from_object_class_name=ref["from_class"],
@@ -165,8 +266,7 @@ class WeaviateClient(ClientInterface):
     def check_object_exists(self, class_name: str, uuid: str) -> bool:
         """Check whether an object with the given UUID exists."""
         try:
-            obj = self.client.data_object.get_by_id(uuid, class_name=class_name)
-            return obj is not None
+            return self.client.data_object.exists(uuid, class_name=class_name)
         except Exception:
             return False
 
@@ -174,16 +274,17 @@ class WeaviateClient(ClientInterface):
         self,
         class_name: str,
         property: Optional[str] = None,
-        value: Optional[str] = None
+        value: Optional[str] = None,
+        fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Retrieve objects via GraphQL, optionally filtered by a property value.
 
         Each returned dict includes an ``_id`` key with the object UUID.
+        Pass *fields* to fetch only those properties; by default every
+        property in the class schema is fetched.
         """
-        # Determine which properties to fetch
-        schema = self.client.schema.get(class_name)
-        prop_names = [p["name"] for p in schema.get("properties", [])]
+        prop_names = fields if fields is not None else self._get_prop_names(class_name)
 
         query = (
             self.client.query
@@ -208,34 +309,100 @@ class WeaviateClient(ClientInterface):
             obj["_id"] = additional.get("id")
         return objects
 
-    def get_all_uuids(self, class_name: str) -> List[str]:
-        """Fetch all UUIDs for a class using cursor-based pagination."""
-        uuids: List[str] = []
+    def get_objects_stream(
+        self,
+        class_name: str,
+        fields: Optional[List[str]] = None,
+        batch_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield all objects of a class page by page using the ``after`` cursor.
+
+        Unlike get_objects this is not capped at one query's limit, and
+        only one page is held in memory at a time. Objects have the same
+        shape as get_objects results, including ``_id``.
+
+        Args:
+            class_name: Class to read
+            fields: Properties to fetch; defaults to every schema property
+            batch_size: Objects per page
+
+        Yields:
+            List[Dict[str, Any]]: One page of objects
+        """
+        prop_names = fields if fields is not None else self._get_prop_names(class_name)
         cursor = None
-        batch_size = 500
 
         while True:
             query = (
                 self.client.query
-                .get(class_name)
+                .get(class_name, prop_names)
                 .with_additional(["id"])
                 .with_limit(batch_size)
             )
             if cursor:
                 query = query.with_after(cursor)
-
             result = query.do()
+
             objects = result.get("data", {}).get("Get", {}).get(class_name, [])
             if not objects:
-                break
-
+                return
             for obj in objects:
-                uid = obj.get("_additional", {}).get("id")
-                if uid:
-                    uuids.append(uid)
-                    cursor = uid
+                additional = obj.pop("_additional", {})
+                obj["_id"] = additional.get("id")
+            yield objects
 
             if len(objects) < batch_size:
+                return
+            cursor = objects[-1]["_id"]
+
+    def _get_prop_names(self, class_name: str) -> List[str]:
+        """Return the property names of a class, cached for SCHEMA_CACHE_TTL."""
+        now = time.monotonic()
+        with self._schema_lock:
+            cached = self._schema_cache.get(class_name)
+            if cached and now - cached[0] < self._schema_cache_ttl:
+                return cached[1]
+
+        schema = self.client.schema.get(class_name)
+        prop_names = [p["name"] for p in schema.get("properties", [])]
+        with self._schema_lock:
+            self._schema_cache[class_name] = (now, prop_names)
+        return prop_names
+
+    def _invalidate_schema_cache(self, class_name: Optional[str] = None) -> None:
+        """Drop cached property names for one class, or all classes."""
+        with self._schema_lock:
+            if class_name is None:
+                self._schema_cache.clear()
+            else:
+                self._schema_cache.pop(class_name, None)
+
+    _UUID_PAGE_SIZE = 10000
+
+    def get_all_uuids(self, class_name: str) -> List[str]:
+        """Fetch all UUIDs for a class using cursor-based pagination.
+
+        Only ``_additional.id`` is requested, so pages can be as large as
+        Weaviate's default QUERY_MAXIMUM_RESULTS without heavy payloads.
+        """
+        uuids: List[str] = []
+        cursor = None
+        page_size = self._UUID_PAGE_SIZE
+
+        while True:
+            after = f', after: "{cursor}"' if cursor else ""
+            result = self.client.query.raw(
+                _UUID_PAGE_TPL % (class_name, page_size, after)
+            )
+            objects = result.get("data", {}).get("Get", {}).get(class_name, [])
+            if not objects:
+                break
+
+            uuids.extend(obj["_additional"]["id"] for obj in objects)
+            cursor = objects[-1]["_additional"]["id"]
+
+            if len(objects) < page_size:
                 break
 
         return uuids
@@ -247,42 +414,82 @@ class WeaviateClient(ClientInterface):
     _METADATA_UUID = "00000000-0000-0000-0000-000000000001"
 
     def set_ingestion_metadata(self, status: str, details: Any = None) -> None:
-        """Create or update the singleton Metadata object tracking ingestion."""
+        """Create or update the singleton Metadata object tracking ingestion.
+
+        ``in_progress`` updates are coalesced and written at most once per
+        METADATA_FLUSH_MS; any other status is written immediately.
+        """
         props = {
             "metaType": "ingestion_status",
             "status": status,
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "details": json.dumps(details) if details else ""
         }
+        self._metadata_writer.write(props)
+        if status != "in_progress":
+            self._metadata_writer.flush()
+
+    def _write_ingestion_metadata(self, props: Dict[str, Any]) -> None:
+        """Persist ingestion status properties with a single upsert."""
+        self._upsert_metadata(self._METADATA_UUID, props)
+
+    def _upsert_metadata(self, uuid: str, props: Dict[str, Any]) -> None:
+        """Create or replace a Metadata object in one round trip."""
         try:
-            existing = self.client.data_object.get_by_id(
-                self._METADATA_UUID, class_name="Metadata"
+            # PUT upserts on current Weaviate versions: one round trip.
+            self.client.data_object.replace(
+                class_name="Metadata",
+                uuid=uuid,
+                data_object=props
             )
-            if existing:
-                self.client.data_object.update(
-                    class_name="Metadata",
-                    uuid=self._METADATA_UUID,
-                    data_object=props
-                )
-            else:
-                self.client.data_object.create(
-                    class_name="Metadata",
-                    data_object=props,
-                    uuid=self._METADATA_UUID
-                )
-        except Exception:
-            # Object doesn't exist yet — create it
+        except UnexpectedStatusCodeException as e:
+            if e.status_code != 404:
+                logger.warning(f"Failed to set ingestion metadata: {e}")
+                return
+            # Older servers reject PUT on a missing object — create it
             try:
                 self.client.data_object.create(
                     class_name="Metadata",
                     data_object=props,
-                    uuid=self._METADATA_UUID
+                    uuid=uuid
                 )
             except Exception as e:
                 logger.warning(f"Failed to set ingestion metadata: {e}")
+        except Exception as e:
+            logger.warning(f"Failed to set ingestion metadata: {e}")
+
+    _CHECKPOINT_UUID = "00000000-0000-0000-0000-000000000002"
+
+    def get_ingestion_checkpoint(self) -> List[str]:
+        """Return the names of ingestion steps recorded as completed."""
+        try:
+            obj = self.client.data_object.get_by_id(
+                self._CHECKPOINT_UUID, class_name="Metadata"
+            )
+            if obj and "properties" in obj:
+                details = obj["properties"].get("details") or "[]"
+                return list(json.loads(details))
+        except Exception as e:
+            logger.debug(f"Could not read ingestion checkpoint: {e}")
+        return []
+
+    def set_ingestion_checkpoint(self, completed_steps: List[str]) -> None:
+        """
+        Record which ingestion steps have completed.
+
+        Stored in its own Metadata object so status heartbeats, which
+        replace the status object's details, cannot clobber it.
+        """
+        self._upsert_metadata(self._CHECKPOINT_UUID, {
+            "metaType": "ingestion_checkpoint",
+            "status": "in_progress" if completed_steps else "cleared",
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "details": json.dumps(completed_steps),
+        })
 
     def get_ingestion_status(self) -> Dict[str, Any]:
         """Read ingestion status from the Metadata class."""
+        self._metadata_writer.flush()
         try:
             obj = self.client.data_object.get_by_id(
                 self._METADATA_UUID, class_name="Metadata"
@@ -316,12 +523,24 @@ class WeaviateClient(ClientInterface):
 
         Args:
             vector_index_config: HNSW vector index settings (distance,
-                efConstruction, maxConnections, ef) applied to classes that
-                have ``vectorSearch: true`` in their schema YAML.  Classes
-                with ``vectorSearch: false`` get their vector index skipped.
+                efConstruction, maxConnections, ef, quantization,
+                pq_segments) applied to classes that have
+                ``vectorSearch: true`` in their schema YAML.  Classes with
+                ``vectorSearch: false`` get their vector index skipped.
+
+        Once every class is known to exist, later calls on this client
+        skip the schema read for SCHEMA_CACHE_TTL seconds.
         """
+        now = time.monotonic()
+        if now - self._schema_verified_at < self._schema_cache_ttl:
+            logger.debug("Schema recently verified - skipping schema check")
+            return
+
         existing = self.client.schema.get()
-        existing_names = {c["class"] for c in existing.get("classes", [])}
+        existing_props = {
+            c["class"]: {p["name"] for p in c.get("properties", [])}
+            for c in existing.get("classes", [])
+        }
 
         schemas_dir = self._find_schemas_dir()
         if not schemas_dir:
@@ -332,8 +551,7 @@ class WeaviateClient(ClientInterface):
         refs_path = os.path.join(schemas_dir, "references.yaml")
         references: Dict[str, List[Dict]] = {}
         if os.path.exists(refs_path):
-            with open(refs_path, "r") as f:
-                references = yaml.safe_load(f) or {}
+            references = _load_yaml(refs_path) or {}
 
         # Build the vectorIndexConfig dict for Weaviate
         vic = vector_index_config or {}
@@ -347,7 +565,20 @@ class WeaviateClient(ClientInterface):
         if "ef" in vic:
             hnsw_config["ef"] = vic["ef"]
 
-        # Load and create each class schema
+        # Optional server-side vector compression: "sq" (8-bit scalar) or
+        # "pq" (product quantization, segments=0 lets Weaviate choose).
+        quantization = vic.get("quantization", "none")
+        if quantization == "sq":
+            hnsw_config["sq"] = {"enabled": True}
+        elif quantization == "pq":
+            hnsw_config["pq"] = {
+                "enabled": True,
+                "segments": vic.get("pq_segments", 0),
+            }
+        elif quantization != "none":
+            logger.warning(f"Unknown vector quantization '{quantization}' - ignoring")
+
+        # Load each class schema and build its Weaviate definition
         schema_files = [
             "metadata.yaml",
             "isco_group.yaml",
@@ -357,16 +588,27 @@ class WeaviateClient(ClientInterface):
             "skill_group.yaml",
         ]
 
+        class_objs: List[Dict[str, Any]] = []
+        ref_props: List[Tuple[str, Dict[str, Any]]] = []
         for fname in schema_files:
             fpath = os.path.join(schemas_dir, fname)
             if not os.path.exists(fpath):
                 continue
 
-            with open(fpath, "r") as f:
-                schema_def = yaml.safe_load(f)
-
+            schema_def = _load_yaml(fpath)
             class_name = schema_def["class"]
-            if class_name in existing_names:
+
+            # Cross-references are added once every class exists; this
+            # also repairs a class left without them by an earlier run
+            present = existing_props.get(class_name, set())
+            for ref in references.get(class_name, []):
+                if ref["name"] not in present:
+                    ref_props.append((class_name, {
+                        "name": ref["name"],
+                        "dataType": ref["dataType"],
+                    }))
+
+            if class_name in existing_props:
                 continue
 
             # Build Weaviate class definition
@@ -394,26 +636,81 @@ class WeaviateClient(ClientInterface):
                     p["tokenization"] = prop["tokenization"]
                 class_obj["properties"].append(p)
 
-            # Add cross-reference properties from references.yaml
-            if class_name in references:
-                for ref in references[class_name]:
-                    class_obj["properties"].append({
-                        "name": ref["name"],
-                        "dataType": ref["dataType"],
-                    })
+            class_objs.append(class_obj)
 
-            try:
-                self.client.schema.create_class(class_obj)
-                logger.info(f"Created schema class: {class_name}")
-                existing_names.add(class_name)
-            except Exception as e:
-                logger.warning(f"Failed to create class {class_name}: {e}")
+        if self._create_classes(class_objs, ref_props):
+            self._schema_verified_at = now
+
+    @staticmethod
+    def _already_exists(error: Exception) -> bool:
+        """Return True if Weaviate rejected a create because it already exists."""
+        return "already exists" in str(error)
+
+    def _create_classes(
+        self,
+        class_objs: List[Dict[str, Any]],
+        ref_props: List[Tuple[str, Dict[str, Any]]]
+    ) -> bool:
+        """Create schema classes, then their cross-reference properties.
+
+        The v3 client's create_class is not atomic for classes with
+        cross-references, so classes are created with primitive properties
+        only and references are added once every target class exists.
+        Both phases run concurrently. Anything that already exists (e.g.
+        created by a concurrent ingester) counts as created.
+
+        Args:
+            class_objs: Class definitions without reference properties
+            ref_props: (class name, reference property) pairs to add
+
+        Returns:
+            bool: True if every class and reference is in place
+        """
+        def run(create: Callable[[Any], None], items: List[Any]) -> List[Optional[Exception]]:
+            def attempt(item: Any) -> Optional[Exception]:
+                try:
+                    create(item)
+                except Exception as e:
+                    if not self._already_exists(e):
+                        return e
+                return None
+
+            if not items:
+                return []
+            with ThreadPoolExecutor(max_workers=len(items)) as executor:
+                return list(executor.map(attempt, items))
+
+        ok = True
+        for class_obj, error in zip(class_objs, run(self.client.schema.create_class, class_objs)):
+            if error is None:
+                logger.info(f"Created schema class: {class_obj['class']}")
+            else:
+                logger.warning(f"Failed to create class {class_obj['class']}: {error}")
+                ok = False
+            self._invalidate_schema_cache(class_obj["class"])
+        if not ok:
+            return False
+
+        def add_ref(item: Tuple[str, Dict[str, Any]]) -> None:
+            self.client.schema.property.create(item[0], item[1])
+
+        for (class_name, prop), error in zip(ref_props, run(add_ref, ref_props)):
+            if error is None:
+                logger.info(f"Added reference {class_name}.{prop['name']}")
+            else:
+                logger.warning(f"Failed to add reference {class_name}.{prop['name']}: {error}")
+                ok = False
+            self._invalidate_schema_cache(class_name)
+        return ok
 
     def delete_schema(self) -> None:
         """Delete all schema classes (synchronous)."""
         self.client.schema.delete_all()
+        self._schema_verified_at = float("-inf")
+        self._invalidate_schema_cache()
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _find_schemas_dir() -> Optional[str]:
         """Locate the resources/schemas directory."""
         candidates = [
@@ -503,9 +800,19 @@ class WeaviateClient(ClientInterface):
     # Async methods (ClientInterface)
     # ------------------------------------------------------------------ #
 
+    async def _run_blocking(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking v3 client call in a worker thread.
+
+        Keeps the event loop responsive; concurrency is capped by
+        WEAVIATE_CONCURRENCY.
+        """
+        async with self._async_limit:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
     async def create_schema(self, schema: Dict[str, Any]) -> None:
         """Create database schema."""
-        self.client.schema.create(schema)
+        await self._run_blocking(self.client.schema.create, schema)
+        self._invalidate_schema_cache()
 
     async def create_object(
         self,
@@ -513,13 +820,102 @@ class WeaviateClient(ClientInterface):
         properties: Dict[str, Any],
         vector: Optional[List[float]] = None
     ) -> str:
-        """Create a new object (async interface)."""
-        return self.client.data_object.create(
-            class_name=class_name,
-            data_object=properties,
-            vector=vector
+        """Create a new object (async interface).
+
+        When a coalescing window is configured, the object is queued and
+        written together with other creates issued in the same window.
+        """
+        if self._coalesce_window <= 0:
+            return await self._run_blocking(
+                self.client.data_object.create,
+                class_name=class_name,
+                data_object=properties,
+                vector=vector
+            )
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        # Random like the IDs Weaviate assigns on the direct path, so every
+        # call creates a new object whether or not it was coalesced
+        object_id = str(uuid4())
+        self._pending_creates.append(
+            (class_name, properties, vector, object_id, future)
         )
 
+        if len(self._pending_creates) >= self._max_coalesced:
+            self._schedule_flush(loop, immediate=True)
+        elif self._flush_handle is None:
+            self._schedule_flush(loop)
+        return await future
+
+    def _schedule_flush(
+        self, loop: asyncio.AbstractEventLoop, immediate: bool = False
+    ) -> None:
+        """Arrange for the pending coalesced creates to be flushed."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if immediate:
+            self._start_flush(loop)
+        else:
+            self._flush_handle = loop.call_later(
+                self._coalesce_window, self._start_flush, loop
+            )
+
+    def _start_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Run a flush as a task that is kept alive until it finishes."""
+        task = loop.create_task(self._flush_pending_creates())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task: asyncio.Task) -> None:
+        """Forget a finished flush task and log it if it failed."""
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Coalesced create flush failed: {task.exception()}")
+
+    async def _flush_pending_creates(self) -> None:
+        """Submit all queued creates as a single batch and resolve callers."""
+        self._flush_handle = None
+        pending, self._pending_creates = self._pending_creates, []
+        if not pending:
+            return
+
+        def submit() -> Dict[str, Any]:
+            with self._batch_lock:
+                self._create_errors = errors = {}
+                try:
+                    # Leaving the block flushes and runs the callback
+                    with self.client.batch as batch:
+                        for class_name, props, vector, object_id, _ in pending:
+                            batch.add_data_object(
+                                class_name=class_name,
+                                data_object=props,
+                                uuid=object_id,
+                                vector=vector
+                            )
+                finally:
+                    self._create_errors = None
+            return errors
+
+        try:
+            errors = await self._run_blocking(submit)
+        except Exception as e:
+            for *_, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for *_, object_id, future in pending:
+            if future.done():
+                continue
+            if object_id in errors:
+                future.set_exception(
+                    RuntimeError(f"Failed to create object {object_id}: {errors[object_id]}")
+                )
+            else:
+                future.set_result(object_id)
+
     async def get_object(
         self,
         class_name: str,
@@ -527,7 +923,8 @@ class WeaviateClient(ClientInterface):
     ) -> Optional[Dict[str, Any]]:
         """Get an object by ID (async interface)."""
         try:
-            return self.client.data_object.get_by_id(
+            return await self._run_blocking(
+                self.client.data_object.get_by_id,
                 class_name=class_name,
                 uuid=object_id
             )
@@ -542,7 +939,8 @@ class WeaviateClient(ClientInterface):
         vector: Optional[List[float]] = None
     ) -> None:
         """Update an object (async interface)."""
-        self.client.data_object.update(
+        await self._run_blocking(
+            self.client.data_object.update,
             class_name=class_name,
             uuid=object_id,
             data_object=properties,
@@ -555,7 +953,8 @@ class WeaviateClient(ClientInterface):
         object_id: str
     ) -> None:
         """Delete an object (async interface)."""
-        self.client.data_object.delete(
+        await self._run_blocking(
+            self.client.data_object.delete,
             class_name=class_name,
             uuid=object_id
         )
@@ -590,7 +989,7 @@ class WeaviateClient(ClientInterface):
             .with_offset(query.offset)
         )
 
-        result = weaviate_query.do()
+        result = await self._run_blocking(weaviate_query.do)
         return result["data"]["Get"][query.class_name]
 
     async def batch_create(
@@ -599,22 +998,19 @@ class WeaviateClient(ClientInterface):
         objects: List[Dict[str, Any]]
     ) -> List[str]:
         """Create multiple objects in batch (async interface)."""
-        with self.client.batch(
-            batch_size=100,
-            callback=self._batch_error_callback,
-        ) as batch:
-            object_ids = []
+        object_ids = [self._object_uuid(class_name, obj) for obj in objects]
 
-            for obj in objects:
-                object_id = generate_uuid5(obj)
-                batch.add_data_object(
-                    class_name=class_name,
-                    data_object=obj,
-                    uuid=object_id
-                )
-                object_ids.append(object_id)
+        def submit() -> None:
+            with self._batch_lock, self.client.batch as batch:
+                for obj, object_id in zip(objects, object_ids):
+                    batch.add_data_object(
+                        class_name=class_name,
+                        data_object=obj,
+                        uuid=object_id
+                    )
 
-            return object_ids
+        await self._run_blocking(submit)
+        return object_ids
 
     async def batch_delete(
         self,
@@ -622,19 +1018,19 @@ class WeaviateClient(ClientInterface):
         object_ids: List[str]
     ) -> None:
         """Delete multiple objects in batch (async interface)."""
-        with self.client.batch(
-            batch_size=100,
-            callback=self._batch_error_callback,
-        ) as batch:
+        def submit() -> None:
+            with self._batch_lock, self.client.batch as batch:
+                for object_id in object_ids:
+                    batch.delete_data_object(
+                        class_name=class_name,
+                        uuid=object_id
+                    )
 
-            for object_id in object_ids:
-                batch.delete_data_object(
-                    class_name=class_name,
-                    uuid=object_id
-                )
+        await self._run_blocking(submit)
 
     def close(self) -> None:
         """Close the client connection."""
+        self._metadata_writer.flush()
         try:
             self.client._connection.close()
         except Exception:
@@ -0,0 +1,132 @@
+"""
+Micro-batching wrapper for embedding models.
+
+Concurrent request threads each need one query embedding. Encoding them
+one by one runs the model once per request; this module coalesces texts
+that arrive within a short window into a single batched encode call.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingEncoder:
+    """
+    Coalesce concurrent single-text encode calls into batched calls.
+
+    The first caller of a window becomes the leader: it waits up to
+    ``max_wait_ms`` (or until ``max_batch_size`` texts are queued), runs
+    ``encode_fn`` once on up to ``max_batch_size`` queued texts, hands
+    every caller in the batch its row and steps down. A caller whose text
+    is still queued then takes over and encodes the next batch right
+    away, so no single caller keeps encoding for others under load.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0
+    ):
+        """
+        Initialize the encoder.
+
+        Args:
+            encode_fn: Callable that encodes a list of texts into a 2-D
+                array with one row per text
+            max_batch_size: Maximum texts per encode_fn call
+            max_wait_ms: How long the leader waits for more texts; 0
+                encodes every call directly
+        """
+        self._encode_fn = encode_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self._max_wait = max_wait_ms / 1000.0
+        self._pending: List[Tuple[str, Future]] = []
+        self._leader_active = False
+        self._cond = threading.Condition()
+
+    def encode(self, text: str) -> np.ndarray:
+        """
+        Encode one text, batched with concurrent callers.
+
+        Args:
+            text: Text to encode
+
+        Returns:
+            np.ndarray: 1-D embedding
+        """
+        if self._max_wait <= 0:
+            return self._encode_fn([text])[0]
+
+        future: Future = Future()
+        with self._cond:
+            self._pending.append((text, future))
+            lead = not self._leader_active
+            if lead:
+                self._leader_active = True
+            elif len(self._pending) >= self.max_batch_size:
+                self._cond.notify_all()
+
+        if lead:
+            self._lead(self._max_wait)
+        # Followers wait for their row, or take over as leader when the
+        # previous one stepped down with their text still queued
+        while not future.done():
+            with self._cond:
+                while not future.done() and self._leader_active:
+                    self._cond.wait()
+                if future.done():
+                    break
+                self._leader_active = True
+            self._lead(0.0)
+        return future.result()
+
+    def encode_many(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Encode texts from one caller in a single call, bypassing the window.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            np.ndarray: 2-D array with one row per text
+        """
+        return self._encode_fn(list(texts))
+
+    def _lead(self, max_wait: float) -> None:
+        """
+        Encode one batch of queued texts, then step down as leader.
+
+        Args:
+            max_wait: Seconds to wait for the batch to fill
+        """
+        deadline = time.monotonic() + max_wait
+        with self._cond:
+            while len(self._pending) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+
+        try:
+            embeddings = self._encode_fn([text for text, _ in batch])
+            for (_, future), embedding in zip(batch, embeddings):
+                future.set_result(embedding)
+        except Exception as e:
+            logger.error(f"Batched encode of {len(batch)} texts failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            with self._cond:
+                self._leader_active = False
+                self._cond.notify_all()
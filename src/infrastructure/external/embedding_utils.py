@@ -6,14 +6,22 @@ using the HuggingFace embedding provider.
 """
 
 import os
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Union
 import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 
 class ESCOEmbedding:
     """
     Utility class for generating embeddings for ESCO data.
     Uses the HuggingFace sentence-transformers model.
+
+    Embeddings are returned L2-normalized, so cosine similarity between
+    two of them is a plain dot product.
+    Recently embedded texts are kept in an in-memory LRU cache
+    (EMB_CACHE_SIZE entries) so repeated labels skip the model.
     """
     
     def __init__(
@@ -26,13 +34,111 @@ class ESCOEmbedding:
         
         Args:
             model_name: Name of the HuggingFace model to use
-            device: Device to use for computation (cpu/cuda/mps)
+            device: Device to use for computation (cpu/cuda/mps). Defaults
+                to TORCH_DEVICE, else CUDA when available, else CPU.
         """
         if device is None:
-            device = "mps" if os.getenv("TORCH_DEVICE") == "mps" else "cpu"
+            device = os.getenv("TORCH_DEVICE") or (
+                "cuda" if torch.cuda.is_available() else "cpu"
+            )
             
         self.model = SentenceTransformer(model_name, device=device)
+        if device in ("cuda", "mps"):
+            # Half precision halves memory traffic on the encoder matmuls
+            self.model.half()
+        self.encode_batch_size = int(os.getenv("ST_BATCH", "128"))
+        self.cache_size = int(os.getenv("EMB_CACHE_SIZE", "50000"))
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        # Encoders are shared across worker threads; LRU moves and
+        # evictions must not interleave
+        self._cache_lock = threading.Lock()
+
+    def _cache_get(self, text: str) -> Optional[np.ndarray]:
+        """Return a cached embedding and mark it most recently used."""
+        with self._cache_lock:
+            embedding = self._cache.get(text)
+            if embedding is not None:
+                self._cache.move_to_end(text)
+            return embedding
+
+    def _cache_put(self, text: str, embedding: np.ndarray) -> None:
+        """Store an embedding, evicting the least recently used entries."""
+        if self.cache_size <= 0:
+            return
+        # Cached vectors are shared with callers, so freeze them
+        embedding.setflags(write=False)
+        with self._cache_lock:
+            self._cache[text] = embedding
+            self._cache.move_to_end(text)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
     
+    def get_embedding_array(self, text: str) -> np.ndarray:
+        """
+        Get embedding for a single text as a float32 array.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            np.ndarray: Read-only 1-D float32 embedding
+        """
+        embedding = self._cache_get(text)
+        if embedding is None:
+            embedding = np.asarray(
+                self.model.encode(
+                    text,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                    show_progress_bar=False
+                ),
+                dtype=np.float32
+            )
+            self._cache_put(text, embedding)
+        return embedding
+
+    def get_embeddings_array(self, texts: List[str]) -> np.ndarray:
+        """
+        Get embeddings for multiple texts as one contiguous float32 matrix.
+        
+        Only texts missing from the cache are sent to the model; rows are
+        returned in input order.
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            np.ndarray: Float32 array of shape (len(texts), dim)
+        """
+        found = {}
+        for text in texts:
+            embedding = self._cache_get(text)
+            if embedding is not None:
+                found[text] = embedding
+        missing = list(dict.fromkeys(t for t in texts if t not in found))
+
+        if missing:
+            embeddings = np.asarray(
+                self.model.encode(
+                    missing,
+                    batch_size=self.encode_batch_size,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                    show_progress_bar=False
+                ),
+                dtype=np.float32
+            )
+            for text, embedding in zip(missing, embeddings):
+                found[text] = embedding
+                self._cache_put(text, embedding)
+
+        if not texts:
+            return np.empty(
+                (0, self.model.get_sentence_embedding_dimension()),
+                dtype=np.float32
+            )
+        return np.stack([found[text] for text in texts])
+
     def get_embedding(self, text: str) -> List[float]:
         """
         Get embedding for a single text.
@@ -43,23 +149,28 @@ class ESCOEmbedding:
         Returns:
             List[float]: Text embedding
         """
-        embedding = self.model.encode(text)
-        return embedding.tolist()
+        return self.get_embedding_array(text).tolist()
     
     def get_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
         Get embeddings for multiple texts.
         
+        List-returning wrapper around get_embeddings_array for callers
+        that need plain Python lists.
+        
         Args:
             texts: List of texts to embed
             
         Returns:
             List[List[float]]: List of text embeddings
         """
-        embeddings = self.model.encode(texts)
-        return embeddings.tolist()
+        return self.get_embeddings_array(texts).tolist()
     
-    def compute_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
+    def compute_similarity(
+        self,
+        embedding1: Union[np.ndarray, List[float]],
+        embedding2: Union[np.ndarray, List[float]]
+    ) -> float:
         """
         Compute cosine similarity between two embeddings.
         
@@ -70,6 +181,6 @@ class ESCOEmbedding:
         Returns:
             float: Cosine similarity score
         """
-        vec1 = np.array(embedding1)
-        vec2 = np.array(embedding2)
-        return float(np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))) 
\ No newline at end of file
+        vec1 = np.asarray(embedding1, dtype=np.float32)
+        vec2 = np.asarray(embedding2, dtype=np.float32)
+        return float(np.dot(vec1, vec2) / np.sqrt(np.dot(vec1, vec1) * np.dot(vec2, vec2)))
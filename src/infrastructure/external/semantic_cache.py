@@ -0,0 +1,247 @@
+"""
+Semantic cache for search results.
+
+This module caches vector search results keyed by the query embedding,
+so a query that is nearly identical to a recent one (typo, reordering,
+rephrasing) reuses its results instead of repeating the Weaviate query.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass
+class _CacheEntry:
+    """One cached result set."""
+    namespace: Hashable
+    embedding: np.ndarray
+    results: List[Dict[str, Any]]
+    expires_at: float
+    lsh_keys: Tuple[int, ...] = ()
+
+
+class SemanticQueryCache:
+    """
+    Thread-safe LRU cache of search results looked up by cosine similarity.
+
+    Entries are grouped by a namespace (e.g. class, limit and certainty
+    threshold) so results for different search parameters never mix. A
+    lookup returns the results of the most similar cached query in the
+    same namespace if its similarity is at least ``threshold``. Entries
+    expire after ``ttl_seconds``.
+
+    Small namespaces are scanned exhaustively. Once a namespace holds
+    more than ``linear_scan_limit`` entries, candidates come from
+    random-projection LSH tables (``num_tables`` hashes of
+    ``bits_per_hash`` sign bits each) and only those are scored, which
+    keeps lookups sub-linear at the cost of occasionally missing a
+    near-duplicate.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 1024,
+        num_tables: int = 8,
+        bits_per_hash: int = 16,
+        linear_scan_limit: int = 256,
+        seed: int = 0
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity between query embeddings
+                for a hit
+            ttl_seconds: Lifetime of a cached result set
+            max_entries: Maximum number of cached result sets; 0 disables
+                the cache
+            num_tables: Number of LSH hash tables; more tables raise recall
+            bits_per_hash: Sign bits per LSH key (at most 64); more bits
+                mean smaller buckets
+            linear_scan_limit: Namespace size up to which lookups scan
+                every entry instead of using LSH
+            seed: Seed for the random projections
+        """
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, _CacheEntry]" = OrderedDict()
+        self._by_namespace: Dict[Hashable, List[int]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+        if not 0 < bits_per_hash <= 64:
+            raise ValueError("bits_per_hash must be between 1 and 64")
+        self.num_tables = num_tables
+        self.bits_per_hash = bits_per_hash
+        self.linear_scan_limit = linear_scan_limit
+        self._rng = np.random.default_rng(seed)
+        # Created on first use, once the embedding dimension is known
+        self._projections: Optional[np.ndarray] = None
+        self._bit_weights = np.left_shift(
+            np.uint64(1), np.arange(bits_per_hash, dtype=np.uint64)
+        )
+        self._buckets: Dict[Tuple[Hashable, int, int], List[int]] = {}
+        # Stacked unit embeddings per namespace for exhaustive lookups
+        self._matrices: Dict[Hashable, np.ndarray] = {}
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        """Return the embedding as a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _lsh_keys(self, vector: np.ndarray) -> Tuple[int, ...]:
+        """Hash a unit vector to one key per table; the caller must hold the lock."""
+        if self._projections is None:
+            self._projections = self._rng.standard_normal(
+                (vector.shape[0], self.num_tables * self.bits_per_hash)
+            ).astype(np.float32)
+        bits = (vector @ self._projections > 0).reshape(self.num_tables, self.bits_per_hash)
+        keys = bits.astype(np.uint64) @ self._bit_weights
+        return tuple(int(key) for key in keys)
+
+    def _candidates(self, namespace: Hashable, query: np.ndarray) -> Tuple[List[int], bool]:
+        """
+        Return entry ids worth scoring and whether they are the whole
+        namespace; the caller must hold the lock.
+        """
+        ids = self._by_namespace[namespace]
+        if len(ids) <= self.linear_scan_limit:
+            return list(ids), True
+        found: Dict[int, None] = {}
+        for table, key in enumerate(self._lsh_keys(query)):
+            for entry_id in self._buckets.get((namespace, table, key), ()):
+                found[entry_id] = None
+        return list(found), False
+
+    def _namespace_matrix(self, namespace: Hashable) -> np.ndarray:
+        """
+        Return the stacked embeddings of a namespace, in entry order.
+
+        The matrix is rebuilt only after the namespace changes, so
+        repeated exhaustive lookups are a single matrix-vector product.
+        The caller must hold the lock.
+        """
+        matrix = self._matrices.get(namespace)
+        if matrix is None:
+            matrix = self._matrices[namespace] = np.stack(
+                [self._entries[i].embedding for i in self._by_namespace[namespace]]
+            )
+        return matrix
+
+    def get(
+        self,
+        namespace: Hashable,
+        embedding: np.ndarray
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up results for a query embedding.
+
+        Args:
+            namespace: Search parameters the results belong to
+            embedding: Query embedding
+
+        Returns:
+            Copy of the cached results, or None on a miss
+        """
+        if self.max_entries <= 0:
+            return None
+
+        query = self._normalize(embedding)
+        now = time.monotonic()
+        with self._lock:
+            if namespace not in self._by_namespace:
+                return None
+
+            # Expiry is checked only on the entries being scored
+            candidates = []
+            scored, whole_namespace = self._candidates(namespace, query)
+            for entry_id in scored:
+                if self._entries[entry_id].expires_at <= now:
+                    self._remove(entry_id)
+                else:
+                    candidates.append(entry_id)
+            if not candidates:
+                return None
+            if whole_namespace:
+                matrix = self._namespace_matrix(namespace)
+            else:
+                matrix = np.stack([self._entries[i].embedding for i in candidates])
+            scores = matrix @ query
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+
+            entry_id = candidates[best]
+            self._entries.move_to_end(entry_id)
+            return [dict(row) for row in self._entries[entry_id].results]
+
+    def put(
+        self,
+        namespace: Hashable,
+        embedding: np.ndarray,
+        results: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Cache results for a query embedding.
+
+        Args:
+            namespace: Search parameters the results belong to
+            embedding: Query embedding
+            results: Search results; a copy is stored
+        """
+        if self.max_entries <= 0:
+            return
+
+        entry = _CacheEntry(
+            namespace=namespace,
+            embedding=self._normalize(embedding),
+            results=[dict(row) for row in results],
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            entry.lsh_keys = self._lsh_keys(entry.embedding)
+            for table, key in enumerate(entry.lsh_keys):
+                self._buckets.setdefault((namespace, table, key), []).append(entry_id)
+            self._entries[entry_id] = entry
+            self._by_namespace.setdefault(namespace, []).append(entry_id)
+            self._matrices.pop(namespace, None)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self._by_namespace.clear()
+            self._buckets.clear()
+            self._matrices.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, entry_id: int) -> None:
+        """Remove one entry; the caller must hold the lock."""
+        entry = self._entries.pop(entry_id)
+        ids = self._by_namespace[entry.namespace]
+        ids.remove(entry_id)
+        self._matrices.pop(entry.namespace, None)
+        if not ids:
+            del self._by_namespace[entry.namespace]
+        for table, key in enumerate(entry.lsh_keys):
+            bucket_key = (entry.namespace, table, key)
+            bucket = self._buckets[bucket_key]
+            bucket.remove(entry_id)
+            if not bucket:
+                del self._buckets[bucket_key]
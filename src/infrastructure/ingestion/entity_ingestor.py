@@ -5,10 +5,15 @@ Handles batch insertion of ESCO entity types (occupations, skills,
 ISCO groups, skill groups, skill collections) into Weaviate.
 """
 
+import functools
 import logging
 import os
+import queue
+import threading
 from datetime import datetime
-from typing import Optional, Callable
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import pandas as pd
 
 from .esco_data_reader import ESCODataReader
 
@@ -35,152 +40,251 @@ class EntityIngestor:
         self.client = client
         self.data_reader = data_reader
         self.heartbeat_callback = heartbeat_callback
+        self._heartbeats: Dict[str, Callable[[int, int], None]] = {}
+        # Prepared batches are uploaded by a single background thread so the
+        # next CSV chunk is parsed while the previous one is in flight. One
+        # consumer also keeps the v3 client's shared batch object
+        # single-threaded when several ingest_* steps run concurrently.
+        self._upload_queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=2)
+        self._upload_errors: List[Exception] = []
+        self._upload_thread: Optional[threading.Thread] = None
+        self._upload_thread_lock = threading.Lock()
 
     def _make_heartbeat(self, step_name: str) -> Optional[Callable[[int, int], None]]:
-        """Create a heartbeat callback bound to a step name."""
+        """Return the heartbeat callback bound to a step name, creating it once."""
         if not self.heartbeat_callback:
             return None
 
-        def callback(processed: int, total: int) -> None:
-            self.heartbeat_callback(step_name, processed, total)
-
+        callback = self._heartbeats.get(step_name)
+        if callback is None:
+            callback = self._heartbeats[step_name] = functools.partial(
+                self.heartbeat_callback, step_name
+            )
         return callback
 
+    def _upload(
+        self,
+        class_name: str,
+        objects: List[Dict[str, Any]],
+        uuids: Optional[List[Optional[str]]] = None
+    ) -> None:
+        """Queue one prepared batch for upload, blocking if two are pending."""
+        with self._upload_thread_lock:
+            if self._upload_thread is None:
+                self._upload_thread = threading.Thread(
+                    target=self._upload_worker,
+                    name="entity-upload",
+                    daemon=True,
+                )
+                self._upload_thread.start()
+        self._upload_queue.put((class_name, objects, uuids))
+
+    def _upload_worker(self) -> None:
+        """Upload queued batches until close() queues the stop sentinel."""
+        while True:
+            item = self._upload_queue.get()
+            if item is None:
+                self._upload_queue.task_done()
+                return
+            class_name, objects, uuids = item
+            try:
+                self.client.batch_add_objects(class_name, objects, uuids)
+            except Exception as e:
+                logger.error(f"Failed to upload {class_name} batch: {e}")
+                self._upload_errors.append(e)
+            finally:
+                self._upload_queue.task_done()
+
+    def _wait_for_uploads(self) -> None:
+        """Block until queued batches are uploaded; re-raise the first failure."""
+        self._upload_queue.join()
+        if self._upload_errors:
+            error = self._upload_errors[0]
+            self._upload_errors.clear()
+            raise error
+
+    def close(self) -> None:
+        """
+        Stop the upload thread once queued batches are uploaded.
+
+        The thread otherwise blocks on the queue for the life of the
+        process and keeps the client alive. A later upload starts a new
+        thread.
+        """
+        with self._upload_thread_lock:
+            thread, self._upload_thread = self._upload_thread, None
+        if thread is not None:
+            self._upload_queue.put(None)
+            thread.join()
+
+    @staticmethod
+    def _has_columns(batch: pd.DataFrame, required: Sequence[str], entity: str) -> bool:
+        """Check once per batch that the required columns are present."""
+        missing = [col for col in required if col not in batch.columns]
+        if missing:
+            logger.error(f"Cannot prepare {entity} batch - missing columns: {missing}")
+            return False
+        return True
+
+    @staticmethod
+    def _columns(batch: pd.DataFrame, names: Sequence[str]) -> List[List[Any]]:
+        """Extract columns as lists, substituting "" for absent columns."""
+        blank = [""] * len(batch)
+        return [
+            batch[name].tolist() if name in batch.columns else blank
+            for name in names
+        ]
+
+    @staticmethod
+    def _split_labels(batch: pd.DataFrame, name: str) -> List[List[str]]:
+        """Split a pipe-separated label column into one list per row."""
+        if name not in batch.columns:
+            return [[] for _ in range(len(batch))]
+        split = batch[name].fillna("").astype(str).str.split("|").tolist()
+        return [[] if labels == [""] else labels for labels in split]
+
     def ingest_isco_groups(self) -> None:
         """Ingest ISCO groups into Weaviate."""
         logger.info("Ingesting ISCO groups...")
+        keys = ("uri", "code", "preferredLabel_en", "description_en", "iscoLevel")
 
         def process_batch(batch):
-            objects = []
-            uuids = []
-            for record in batch.to_dict("records"):
-                try:
-                    data = {
-                        "uri": record["conceptUri"],
-                        "code": record.get("code", ""),
-                        "preferredLabel_en": record.get("preferredLabel", ""),
-                        "description_en": record.get("description", ""),
-                        "iscoLevel": record.get("iscoLevel", ""),
-                    }
-                    data = {k: v for k, v in data.items() if v is not None and v != ""}
-                    uuid = data["uri"].split("/")[-1]
-                    objects.append(data)
-                    uuids.append(uuid)
-                except Exception as e:
-                    logger.error(f"Failed to prepare ISCO group: {e}")
+            if not self._has_columns(batch, ("conceptUri",), "ISCO group"):
+                return
+            columns = self._columns(
+                batch,
+                ("conceptUri", "code", "preferredLabel", "description", "iscoLevel")
+            )
+            if not all(columns[0]):
+                keep = [i for i, uri in enumerate(columns[0]) if uri]
+                columns = [[col[i] for i in keep] for col in columns]
+
+            # Empty values are omitted from the objects. Decide per column
+            # once: fully populated columns are copied as-is, all-empty
+            # ones are dropped, and only partly empty ones are checked
+            # row by row.
+            dense = [(k, col) for k, col in zip(keys, columns) if all(col)]
+            sparse = [(k, col) for k, col in zip(keys, columns) if any(col) and not all(col)]
+            dense_keys = [k for k, _ in dense]
+            objects = [
+                dict(zip(dense_keys, row))
+                for row in zip(*(col for _, col in dense))
+            ]
+            for key, col in sparse:
+                for obj, value in zip(objects, col):
+                    if value:
+                        obj[key] = value
+            uuids = [uri.rpartition("/")[2] for uri in columns[0]]
             if objects:
-                self.client.batch_add_objects("ISCOGroup", objects, uuids)
+                self._upload("ISCOGroup", objects, uuids)
 
         self.data_reader.process_csv_in_batches(
             "ISCOGroups_en.csv", process_batch,
             self._make_heartbeat("ingest_isco_groups")
         )
+        self._wait_for_uploads()
         logger.info("ISCO group ingestion completed")
 
     def ingest_occupations(self) -> None:
         """Ingest occupations from CSV."""
         logger.info("Starting occupation ingestion...")
+        keys = (
+            "uri", "preferredLabel_en", "description_en",
+            "definition_en", "code", "altLabels_en",
+        )
 
         def process_batch(batch):
-            objects = []
-            for record in batch.to_dict("records"):
-                try:
-                    alt = record.get("altLabels_en", "")
-                    objects.append({
-                        "uri": record["conceptUri"],
-                        "preferredLabel_en": record["preferredLabel_en"],
-                        "description_en": record.get("description_en", ""),
-                        "definition_en": record.get("definition_en", ""),
-                        "code": record.get("code", ""),
-                        "altLabels_en": alt.split("|") if isinstance(alt, str) and alt else [],
-                    })
-                except Exception as e:
-                    logger.error(f"Error preparing occupation: {e}")
+            if not self._has_columns(batch, ("conceptUri", "preferredLabel_en"), "occupation"):
+                return
+            columns = self._columns(batch, (
+                "conceptUri", "preferredLabel_en", "description_en",
+                "definition_en", "code",
+            ))
+            objects = [
+                dict(zip(keys, row))
+                for row in zip(*columns, self._split_labels(batch, "altLabels_en"))
+            ]
             if objects:
-                self.client.batch_add_objects("Occupation", objects)
+                self._upload("Occupation", objects)
 
         self.data_reader.process_csv_in_batches(
             "occupations_en.csv", process_batch,
             self._make_heartbeat("ingest_occupations")
         )
+        self._wait_for_uploads()
         logger.info("Occupation ingestion completed")
 
     def ingest_skills(self) -> None:
         """Ingest skills from CSV."""
         logger.info("Starting skill ingestion...")
+        keys = (
+            "uri", "preferredLabel_en", "description_en",
+            "skillType", "reuseLevel", "altLabels_en",
+        )
 
         def process_batch(batch):
-            objects = []
-            for record in batch.to_dict("records"):
-                try:
-                    alt = record.get("altLabels_en", "")
-                    objects.append({
-                        "uri": record["conceptUri"],
-                        "preferredLabel_en": record["preferredLabel_en"],
-                        "description_en": record.get("description_en", ""),
-                        "skillType": record.get("skillType", ""),
-                        "reuseLevel": record.get("reuseLevel", ""),
-                        "altLabels_en": alt.split("|") if isinstance(alt, str) and alt else [],
-                    })
-                except Exception as e:
-                    logger.error(f"Error preparing skill: {e}")
+            if not self._has_columns(batch, ("conceptUri", "preferredLabel_en"), "skill"):
+                return
+            columns = self._columns(batch, (
+                "conceptUri", "preferredLabel_en", "description_en",
+                "skillType", "reuseLevel",
+            ))
+            objects = [
+                dict(zip(keys, row))
+                for row in zip(*columns, self._split_labels(batch, "altLabels_en"))
+            ]
             if objects:
-                self.client.batch_add_objects("Skill", objects)
+                self._upload("Skill", objects)
 
         self.data_reader.process_csv_in_batches(
             "skills_en.csv", process_batch,
             self._make_heartbeat("ingest_skills")
         )
+        self._wait_for_uploads()
         logger.info("Skill ingestion completed")
 
-    def ingest_skill_groups(self) -> None:
-        """Ingest skill groups from CSV."""
-        logger.info("Starting skill group ingestion...")
+    def _ingest_labelled_concepts(
+        self,
+        class_name: str,
+        filename: str,
+        step_name: str,
+        entity: str
+    ) -> None:
+        """Ingest a CSV of concepts with only labels and a description."""
+        keys = ("uri", "preferredLabel_en", "description_en", "altLabels_en")
 
         def process_batch(batch):
-            objects = []
-            for record in batch.to_dict("records"):
-                try:
-                    alt = record.get("altLabels_en", "")
-                    objects.append({
-                        "uri": record["conceptUri"],
-                        "preferredLabel_en": record["preferredLabel_en"],
-                        "description_en": record.get("description_en", ""),
-                        "altLabels_en": alt.split("|") if isinstance(alt, str) and alt else [],
-                    })
-                except Exception as e:
-                    logger.error(f"Error preparing skill group: {e}")
+            if not self._has_columns(batch, ("conceptUri", "preferredLabel_en"), entity):
+                return
+            columns = self._columns(batch, (
+                "conceptUri", "preferredLabel_en", "description_en",
+            ))
+            objects = [
+                dict(zip(keys, row))
+                for row in zip(*columns, self._split_labels(batch, "altLabels_en"))
+            ]
             if objects:
-                self.client.batch_add_objects("SkillGroup", objects)
+                self._upload(class_name, objects)
 
         self.data_reader.process_csv_in_batches(
-            "skillGroups_en.csv", process_batch,
-            self._make_heartbeat("ingest_skill_groups")
+            filename, process_batch, self._make_heartbeat(step_name)
+        )
+        self._wait_for_uploads()
+
+    def ingest_skill_groups(self) -> None:
+        """Ingest skill groups from CSV."""
+        logger.info("Starting skill group ingestion...")
+        self._ingest_labelled_concepts(
+            "SkillGroup", "skillGroups_en.csv",
+            "ingest_skill_groups", "skill group"
         )
         logger.info("Skill group ingestion completed")
 
     def ingest_skill_collections(self) -> None:
         """Ingest skill collections from CSV."""
         logger.info("Starting skill collection ingestion...")
-
-        def process_batch(batch):
-            objects = []
-            for record in batch.to_dict("records"):
-                try:
-                    alt = record.get("altLabels_en", "")
-                    objects.append({
-                        "uri": record["conceptUri"],
-                        "preferredLabel_en": record["preferredLabel_en"],
-                        "description_en": record.get("description_en", ""),
-                        "altLabels_en": alt.split("|") if isinstance(alt, str) and alt else [],
-                    })
-                except Exception as e:
-                    logger.error(f"Error preparing skill collection: {e}")
-            if objects:
-                self.client.batch_add_objects("SkillCollection", objects)
-
-        self.data_reader.process_csv_in_batches(
-            "conceptSchemes_en.csv", process_batch,
-            self._make_heartbeat("ingest_skill_collections")
+        self._ingest_labelled_concepts(
+            "SkillCollection", "conceptSchemes_en.csv",
+            "ingest_skill_collections", "skill collection"
         )
         logger.info("Skill collection ingestion completed")
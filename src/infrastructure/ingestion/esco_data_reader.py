@@ -7,27 +7,41 @@ for ESCO taxonomy data files.
 
 import os
 import logging
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
 logger = logging.getLogger(__name__)
 
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
+
 
 class ESCODataReader:
     """Reads and pre-processes ESCO CSV data files in batches."""
 
-    def __init__(self, data_dir: str, batch_size: int = 100):
+    def __init__(
+        self,
+        data_dir: str,
+        batch_size: int = 100,
+        heartbeat_interval: int = 1000
+    ):
         """
         Initialize the data reader.
 
         Args:
             data_dir: Directory containing ESCO CSV files
             batch_size: Number of rows per processing batch
+            heartbeat_interval: Minimum rows processed between heartbeats
         """
         self.data_dir = data_dir
         self.batch_size = batch_size
+        self.heartbeat_interval = heartbeat_interval
 
     def process_csv_in_batches(
         self,
@@ -38,6 +52,10 @@ class ESCODataReader:
         """
         Process a CSV file in batches with optional heartbeat updates.
 
+        The file is streamed in chunks of ``batch_size`` rows, so memory use
+        stays bounded by one batch. All values are read as strings with NA
+        parsing disabled; missing cells arrive as empty strings.
+
         Args:
             filename: CSV file name (relative to data_dir)
             process_func: Function to process each batch DataFrame
@@ -48,32 +66,67 @@ class ESCODataReader:
             logger.warning(f"File not found: {file_path} - skipping.")
             return
 
-        df = pd.read_csv(file_path)
-        total_rows = len(df)
+        total_rows = self._count_rows(file_path)
         rows_processed = 0
-
-        with tqdm(
+        rows_since_heartbeat = 0
+
+        with pd.read_csv(
+            file_path,
+            chunksize=self.batch_size,
+            dtype=str,
+            keep_default_na=False,
+            na_filter=False,
+        ) as reader, tqdm(
             total=total_rows,
             desc=f"Processing {filename}",
             unit="rows",
+            mininterval=1.0,
             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
         ) as pbar:
-            for start_idx in range(0, total_rows, self.batch_size):
-                end_idx = min(start_idx + self.batch_size, total_rows)
-                batch = df.iloc[start_idx:end_idx]
+            for batch in reader:
                 process_func(batch)
                 rows_processed += len(batch)
+                rows_since_heartbeat += len(batch)
                 pbar.update(len(batch))
 
-                if heartbeat_callback and rows_processed % 1000 == 0:
+                # Count rows rather than test for exact multiples, so
+                # heartbeats fire for any batch size.
+                if heartbeat_callback and rows_since_heartbeat >= self.heartbeat_interval:
                     heartbeat_callback(rows_processed, total_rows)
+                    rows_since_heartbeat = 0
+
+    @staticmethod
+    def _count_rows(file_path: str) -> int:
+        """
+        Estimate the number of data rows from the file's line count.
+
+        Used only for progress reporting; quoted fields spanning several
+        lines make this an upper bound.
+        """
+        lines = 0
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                lines += block.count(b"\n")
+        return max(lines - 1, 0)
 
-    def read_csv(self, filename: str) -> Optional[pd.DataFrame]:
+    def read_csv(
+        self,
+        filename: str,
+        columns: Optional[List[str]] = None,
+        dtype: Optional[str] = None
+    ) -> Optional[pd.DataFrame]:
         """
         Read a full CSV file and return as DataFrame.
 
+        Uses the multithreaded PyArrow parser when pyarrow is installed.
+        That parser rejects quoted fields spanning several lines (e.g.
+        multi-line altLabels), so such files are re-read with the C parser.
+
         Args:
             filename: CSV file name (relative to data_dir)
+            columns: Optional subset of columns to parse; columns not
+                present in the file are ignored
+            dtype: Optional dtype for all columns, e.g. "string[pyarrow]"
 
         Returns:
             DataFrame or None if file doesn't exist
@@ -82,7 +135,19 @@ class ESCODataReader:
         if not os.path.exists(file_path):
             logger.warning(f"File not found: {file_path} - skipping.")
             return None
-        return pd.read_csv(file_path)
+        usecols = None
+        if columns is not None:
+            header = pd.read_csv(file_path, nrows=0).columns
+            usecols = [col for col in columns if col in header]
+        try:
+            return pd.read_csv(
+                file_path, engine=_CSV_ENGINE, usecols=usecols, dtype=dtype
+            )
+        except pd.errors.ParserError:
+            if _CSV_ENGINE == "c":
+                raise
+            logger.debug(f"{filename} has multi-line fields - re-reading with the C parser")
+            return pd.read_csv(file_path, engine="c", usecols=usecols, dtype=dtype)
 
     @staticmethod
     def standardize_hierarchy_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -94,24 +159,33 @@ class ESCODataReader:
         - parentUri / childUri
         - broaderSkillUri / skillUri
         - Level X URI format
+
+        Column dtypes are preserved, so Arrow-backed string columns stay
+        Arrow-backed for the vectorized relation code.
         """
         rename_map = {}
 
         if "Level 0 URI" in df.columns:
-            def get_broader_narrower(row):
-                levels = [f"Level {i} URI" for i in range(4)]
-                non_empty = [
-                    lv for lv in levels
-                    if lv in df.columns and pd.notna(row[lv]) and row[lv] != ""
-                ]
-                if len(non_empty) >= 2:
-                    return pd.Series([row[non_empty[-2]], row[non_empty[-1]]])
-                return pd.Series([None, None])
-
-            df[["broaderUri", "narrowerUri"]] = df.apply(
-                get_broader_narrower, axis=1
-            )
-            df = df.dropna(subset=["broaderUri", "narrowerUri"])
+            # Broader/narrower are the last two non-empty Level URI cells
+            # of each row, located with array ops instead of a row apply.
+            levels = [f"Level {i} URI" for i in range(4) if f"Level {i} URI" in df.columns]
+            mat = df[levels].fillna("").to_numpy(dtype=object)
+            nonempty = mat != ""
+            rows = np.arange(len(mat))
+            last_col = len(levels) - 1
+
+            narrower_idx = last_col - np.argmax(nonempty[:, ::-1], axis=1)
+            nonempty[rows, narrower_idx] = False
+            broader_idx = last_col - np.argmax(nonempty[:, ::-1], axis=1)
+            has_pair = nonempty[rows, broader_idx]
+
+            # Rebuild the picked cells with the source dtype rather than
+            # leaving them as object arrays.
+            dtype = df[levels[0]].dtype
+            df = df.assign(
+                broaderUri=pd.Series(mat[rows, broader_idx], index=df.index, dtype=dtype),
+                narrowerUri=pd.Series(mat[rows, narrower_idx], index=df.index, dtype=dtype),
+            )[has_pair]
             df = df[df["broaderUri"] != df["narrowerUri"]]
             return df
 
@@ -131,7 +205,7 @@ class ESCODataReader:
                     break
 
         if rename_map:
-            df = df.rename(columns=rename_map)
+            df = df.rename(columns=rename_map, copy=False)
         return df
 
     @staticmethod
@@ -141,6 +215,8 @@ class ESCODataReader:
         """
         Rename alternative column names for skill-collection relation CSVs
         so downstream code can assume conceptSchemeUri and skillUri.
+
+        Only column labels change; the column arrays are reused as-is.
         """
         rename_map = {}
         if "conceptSchemeUri" not in df.columns:
@@ -154,5 +230,5 @@ class ESCODataReader:
                     rename_map[alt] = "skillUri"
                     break
         if rename_map:
-            df = df.rename(columns=rename_map)
+            df = df.rename(columns=rename_map, copy=False)
         return df
@@ -1,13 +1,19 @@
 """
 Ingestion orchestrator for ESCO data.
 
-Coordinates the full 12-step ESCO ingestion pipeline:
-schema setup, 5 entity types, and 6 relation types.
+Coordinates the full 13-step ESCO ingestion pipeline:
+schema setup, 5 entity types, a UUID prefetch, and 6 relation
+types. The pipeline is declared as a list of steps with
+dependencies and run in dependency order.
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List, Set, Tuple
 
 from .esco_data_reader import ESCODataReader
 from .entity_ingestor import EntityIngestor
@@ -16,6 +22,14 @@ from .relation_builder import RelationBuilder
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class Step:
+    """One pipeline step and the names of the steps it waits for."""
+    name: str
+    func: Callable[[], Any]
+    depends_on: Tuple[str, ...] = ()
+
+
 class IngestionOrchestrator:
     """Orchestrates the complete ESCO ingestion process."""
 
@@ -23,9 +37,11 @@ class IngestionOrchestrator:
         self,
         client,
         data_dir: str,
-        batch_size: int = 100,
+        batch_size: int = 1000,
         progress_callback: Optional[Callable] = None,
         vector_index_config: Optional[Dict[str, Any]] = None,
+        refs_batch_size: int = 10_000,
+        force: bool = False,
     ):
         """
         Initialize the orchestrator.
@@ -33,18 +49,37 @@ class IngestionOrchestrator:
         Args:
             client: WeaviateClient instance
             data_dir: Directory containing ESCO CSV files
-            batch_size: Batch size for CSV processing
+            batch_size: Rows per CSV batch; each batch is uploaded in one
+                Weaviate batch context, so this caps objects per flush
             progress_callback: Optional progress callback
             vector_index_config: HNSW settings passed to ensure_schema()
+            refs_batch_size: Cross-references handed to the client per call
+            force: Ignore the checkpoint from an interrupted run and
+                re-run every step
         """
         self.client = client
         self.data_dir = data_dir
         self.batch_size = batch_size
         self.progress_callback = progress_callback
         self.vector_index_config = vector_index_config or {}
+        self.refs_batch_size = refs_batch_size
+        self.force = force
+        self.step_timings: Dict[str, float] = {}
+        self._last_hb = 0.0
+        self._hb_interval = 1.0
 
     def _update_heartbeat(self, step_name: str, processed: int = 0, total: int = 0) -> None:
-        """Update heartbeat metadata for a given step."""
+        """
+        Update heartbeat metadata for a given step.
+
+        Progress heartbeats are throttled to one per ``_hb_interval``
+        seconds; step starts and final heartbeats (processed == total)
+        are always written.
+        """
+        now = time.monotonic()
+        if processed != total and now - self._last_hb < self._hb_interval:
+            return
+        self._last_hb = now
         try:
             self.client.set_ingestion_metadata(
                 status="in_progress",
@@ -57,50 +92,180 @@ class IngestionOrchestrator:
         except Exception as e:
             logger.debug(f"Heartbeat update failed: {e}")
 
+    def _build_plan(
+        self,
+        entity_ingestor: EntityIngestor,
+        relation_builder: RelationBuilder,
+    ) -> List[Step]:
+        """Describe the 13 pipeline steps and the steps each one waits for."""
+        return [
+            # EntityIngestor shares one upload queue between its steps,
+            # so entity steps form a chain.
+            Step("ensure_schema", lambda: self.client.ensure_schema(
+                vector_index_config=self.vector_index_config
+            )),
+            Step("ingest_isco_groups", entity_ingestor.ingest_isco_groups,
+                 ("ensure_schema",)),
+            Step("ingest_occupations", entity_ingestor.ingest_occupations,
+                 ("ingest_isco_groups",)),
+            Step("ingest_skills", entity_ingestor.ingest_skills,
+                 ("ingest_occupations",)),
+            Step("ingest_skill_groups", entity_ingestor.ingest_skill_groups,
+                 ("ingest_skills",)),
+            Step("ingest_skill_collections", entity_ingestor.ingest_skill_collections,
+                 ("ingest_skill_groups",)),
+            # Fetch the UUIDs of every class the relation steps resolve
+            # in parallel up front, instead of the first relation step
+            # to need a class fetching it while the others wait.
+            Step("prefetch_uuids", relation_builder.prefetch_all,
+                 ("ingest_isco_groups", "ingest_occupations",
+                  "ingest_skills", "ingest_skill_collections")),
+            # Relation steps only add references and run concurrently.
+            Step("create_skill_relations", relation_builder.create_skill_relations,
+                 ("prefetch_uuids",)),
+            Step("create_hierarchical_relations", relation_builder.create_hierarchical_relations,
+                 ("prefetch_uuids",)),
+            Step("create_isco_group_relations", relation_builder.create_isco_group_relations,
+                 ("prefetch_uuids",)),
+            Step("create_skill_collection_relations", relation_builder.create_skill_collection_relations,
+                 ("prefetch_uuids",)),
+            Step("create_skill_skill_relations", relation_builder.create_skill_skill_relations,
+                 ("prefetch_uuids",)),
+            Step("create_broader_skill_relations", relation_builder.create_broader_skill_relations,
+                 ("prefetch_uuids",)),
+        ]
+
+    @staticmethod
+    def _topological_order(steps: List[Step]) -> List[Step]:
+        """
+        Order steps so every step comes after its dependencies.
+
+        Ties keep declaration order.
+
+        Raises:
+            ValueError: If a dependency is unknown or the plan has a cycle
+        """
+        by_name = {step.name: step for step in steps}
+        for step in steps:
+            unknown = [dep for dep in step.depends_on if dep not in by_name]
+            if unknown:
+                raise ValueError(f"Step {step.name} depends on unknown steps: {unknown}")
+
+        ordered: List[Step] = []
+        placed: Set[str] = set()
+        remaining = list(steps)
+        while remaining:
+            ready = [s for s in remaining if all(dep in placed for dep in s.depends_on)]
+            if not ready:
+                raise ValueError(
+                    f"Ingestion plan has a dependency cycle among: {[s.name for s in remaining]}"
+                )
+            for step in ready:
+                ordered.append(step)
+                placed.add(step.name)
+            remaining = [s for s in remaining if s.name not in placed]
+        return ordered
+
+    @staticmethod
+    def _run_plan(steps: List[Step], run_step: Callable[[int, Step], None]) -> None:
+        """
+        Run steps concurrently, starting each once its dependencies finish.
+
+        After the first failure no new steps are started; running steps
+        are allowed to finish and the first error is then re-raised.
+        """
+        ordered = IngestionOrchestrator._topological_order(steps)
+        positions = {step.name: idx for idx, step in enumerate(ordered, 1)}
+        pending = list(ordered)
+        done: Set[str] = set()
+        running: Dict[Future, str] = {}
+        error: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(max_workers=len(ordered)) as executor:
+            while pending or running:
+                if error is None:
+                    ready = [s for s in pending if all(dep in done for dep in s.depends_on)]
+                    for step in ready:
+                        pending.remove(step)
+                        running[executor.submit(run_step, positions[step.name], step)] = step.name
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        future.result()
+                        done.add(name)
+                    except Exception as e:
+                        error = error or e
+
+        if error is not None:
+            raise error
+
     def run_complete_ingestion(self) -> Dict[str, Any]:
         """
-        Run the complete 12-step ESCO ingestion pipeline.
+        Run the complete 13-step ESCO ingestion pipeline.
+
+        Steps run as soon as the steps they depend on have finished, so
+        the relation steps run concurrently once the UUIDs are prefetched. Completed
+        steps are checkpointed in Weaviate, so a run that fails part-way
+        resumes after the last completed step unless ``force`` is set.
+        The checkpoint is cleared once the pipeline finishes. Wall-clock
+        seconds per step are kept in ``step_timings``.
 
         Returns:
             Dictionary with step completion status
         """
         logger.info("Starting complete ESCO ingestion pipeline")
         results: Dict[str, Any] = {}
+        self.step_timings = {}
 
         data_reader = ESCODataReader(self.data_dir, self.batch_size)
         entity_ingestor = EntityIngestor(
             self.client, data_reader,
             heartbeat_callback=self._update_heartbeat
         )
-        relation_builder = RelationBuilder(self.client, data_reader)
+        relation_builder = RelationBuilder(
+            self.client, data_reader, refs_batch_size=self.refs_batch_size
+        )
+        steps = self._build_plan(entity_ingestor, relation_builder)
 
-        steps = [
-            ("ensure_schema", lambda: self.client.ensure_schema(
-                vector_index_config=self.vector_index_config
-            )),
-            ("ingest_isco_groups", entity_ingestor.ingest_isco_groups),
-            ("ingest_occupations", entity_ingestor.ingest_occupations),
-            ("ingest_skills", entity_ingestor.ingest_skills),
-            ("ingest_skill_groups", entity_ingestor.ingest_skill_groups),
-            ("ingest_skill_collections", entity_ingestor.ingest_skill_collections),
-            ("create_skill_relations", relation_builder.create_skill_relations),
-            ("create_hierarchical_relations", relation_builder.create_hierarchical_relations),
-            ("create_isco_group_relations", relation_builder.create_isco_group_relations),
-            ("create_skill_collection_relations", relation_builder.create_skill_collection_relations),
-            ("create_skill_skill_relations", relation_builder.create_skill_skill_relations),
-            ("create_broader_skill_relations", relation_builder.create_broader_skill_relations),
-        ]
+        total = len(steps)
+        completed: List[str] = [] if self.force else self.client.get_ingestion_checkpoint()
+        if self.force:
+            self.client.set_ingestion_checkpoint([])
+        elif completed:
+            logger.info(f"Resuming ingestion; already completed: {', '.join(completed)}")
+        checkpoint_lock = threading.Lock()
 
-        for idx, (step_name, step_func) in enumerate(steps, 1):
-            logger.info(f"Step {idx}/{len(steps)}: {step_name}")
-            self._update_heartbeat(step_name)
+        def run_step(idx: int, step: Step) -> None:
+            if step.name in completed:
+                logger.info(f"Step {idx}/{total}: {step.name} (skipped, already completed)")
+                results[step.name] = "skipped"
+                return
+            logger.info(f"Step {idx}/{total}: {step.name}")
+            self._update_heartbeat(step.name)
+            started = time.perf_counter()
             try:
-                step_func()
-                results[step_name] = "completed"
+                step.func()
+                results[step.name] = "completed"
             except Exception as e:
-                logger.error(f"Step {step_name} failed: {e}")
-                results[step_name] = f"failed: {e}"
+                logger.error(f"Step {step.name} failed: {e}")
+                results[step.name] = f"failed: {e}"
                 raise
+            finally:
+                self.step_timings[step.name] = round(time.perf_counter() - started, 3)
+            logger.info(f"Step {step.name} finished in {self.step_timings[step.name]}s")
+            with checkpoint_lock:
+                completed.append(step.name)
+                self.client.set_ingestion_checkpoint(list(completed))
+
+        try:
+            self._run_plan(steps, run_step)
+        finally:
+            # Entity steps are done (or abandoned); release the upload thread
+            entity_ingestor.close()
 
+        self.client.set_ingestion_checkpoint([])
         logger.info("Complete ESCO ingestion pipeline finished")
         return results
@@ -25,20 +25,32 @@ def wait_for_weaviate(client: WeaviateClient, max_retries: int = 30, retry_inter
     """
     Wait for Weaviate to become available.
 
+    Polls with exponential backoff starting at 100 ms and capped at
+    ``retry_interval``, so an already-running instance is detected almost
+    immediately while the overall wait stays bounded by
+    ``max_retries * retry_interval`` seconds.
+
     Args:
         client: Weaviate client
-        max_retries: Maximum number of retry attempts
-        retry_interval: Time between retries in seconds
+        max_retries: Number of ``retry_interval`` periods to wait in total
+        retry_interval: Maximum time between retries in seconds
 
     Returns:
         bool: True if Weaviate is available, False otherwise
     """
-    for attempt in range(max_retries):
+    deadline = time.monotonic() + max_retries * retry_interval
+    delay = 0.1
+    attempt = 0
+    while True:
+        attempt += 1
         if client.is_connected():
             return True
-        logger.info(f"Waiting for Weaviate to become available (attempt {attempt + 1}/{max_retries})")
-        time.sleep(retry_interval)
-    return False
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        logger.info(f"Waiting for Weaviate to become available (attempt {attempt}, retrying in {delay:.1f}s)")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.5, retry_interval)
 
 
 def init_ingestion():
@@ -96,7 +108,7 @@ def init_ingestion():
             orchestrator = IngestionOrchestrator(
                 client=client,
                 data_dir=str(data_dir),
-                batch_size=100,
+                batch_size=int(os.getenv("ESCO_BATCH_SIZE", "1000")),
             )
             orchestrator.run_complete_ingestion()
             logger.info("Orchestrator ingestion completed successfully")
@@ -6,10 +6,14 @@ pre-fetched UUID caches for efficient lookups.
 """
 
 import logging
-from typing import Set
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Set, Union
 
+import numpy as np
 import pandas as pd
-from tqdm import tqdm
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from .esco_data_reader import ESCODataReader
 
@@ -19,71 +23,216 @@ logger = logging.getLogger(__name__)
 class RelationBuilder:
     """Builds cross-reference relations between ESCO entities."""
 
-    def __init__(self, client, data_reader: ESCODataReader):
+    def __init__(
+        self,
+        client,
+        data_reader: ESCODataReader,
+        refs_batch_size: int = 10_000
+    ):
         """
         Initialize the relation builder.
 
         Args:
             client: WeaviateClient instance
             data_reader: ESCODataReader for CSV access
+            refs_batch_size: References handed to the client per
+                batch_add_references call
         """
         self.client = client
         self.data_reader = data_reader
+        self.refs_batch_size = refs_batch_size
         self._uuid_cache: dict[str, Set[str]] = {}
+        self._uuid_index_cache: dict[str, pd.Index] = {}
+        self._uuid_lock = threading.Lock()
+        self._class_locks: dict[str, threading.Lock] = {}
+        self._csv_cache: dict[str, Optional[pd.DataFrame]] = {}
+        self._csv_lock = threading.Lock()
+
+    def _read_shared_csv(self, filename: str) -> Optional[pd.DataFrame]:
+        """
+        Read a CSV used by more than one relation step, parsing it once.
+
+        Callers must not modify the returned frame in place.
+        """
+        with self._csv_lock:
+            if filename not in self._csv_cache:
+                self._csv_cache[filename] = self.data_reader.read_csv(filename)
+            return self._csv_cache[filename]
 
     def _prefetch_uuids(self, class_name: str) -> Set[str]:
-        """Pre-fetch all UUIDs for a class (cached)."""
-        if class_name not in self._uuid_cache:
+        """
+        Pre-fetch all UUIDs for a class (cached, thread-safe).
+
+        Fetches are serialized per class only, so steps that need
+        different classes can fetch concurrently.
+        """
+        with self._uuid_lock:
+            uuids = self._uuid_cache.get(class_name)
+            if uuids is not None:
+                return uuids
+            class_lock = self._class_locks.setdefault(class_name, threading.Lock())
+
+        with class_lock:
+            with self._uuid_lock:
+                uuids = self._uuid_cache.get(class_name)
+            if uuids is None:
+                logger.info(f"Pre-fetching UUIDs for {class_name}...")
+                uuids = set(self.client.get_all_uuids(class_name))
+                logger.info(f"Pre-fetched {len(uuids)} UUIDs for {class_name}")
+                with self._uuid_lock:
+                    uuids = self._uuid_cache.setdefault(class_name, uuids)
+            return uuids
+
+    def _uuid_index(self, class_name: str) -> pd.Index:
+        """
+        Return the cached UUIDs of a class as a pandas Index.
+
+        The Index builds its hash table once and keeps it, so repeated
+        column lookups reuse it instead of rehashing the UUID set each time.
+        """
+        uuids = self._prefetch_uuids(class_name)
+        with self._uuid_lock:
+            index = self._uuid_index_cache.get(class_name)
+            if index is None:
+                index = self._uuid_index_cache[class_name] = pd.Index(list(uuids))
+            return index
+
+    def prefetch_all(
+        self,
+        classes: Sequence[str] = ("Occupation", "Skill", "SkillCollection", "ISCOGroup"),
+    ) -> None:
+        """Warm the UUID cache for several classes with concurrent fetches."""
+        with self._uuid_lock:
+            missing = [c for c in classes if c not in self._uuid_cache]
+        if not missing:
+            return
+
+        def fetch(class_name: str) -> Set[str]:
             logger.info(f"Pre-fetching UUIDs for {class_name}...")
-            uuids = set(self.client.get_all_uuids(class_name))
-            logger.info(f"Pre-fetched {len(uuids)} UUIDs for {class_name}")
-            self._uuid_cache[class_name] = uuids
-        return self._uuid_cache[class_name]
+            return set(self.client.get_all_uuids(class_name))
+
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            fetched = dict(zip(missing, executor.map(fetch, missing)))
+
+        with self._uuid_lock:
+            for class_name, uuids in fetched.items():
+                logger.info(f"Pre-fetched {len(uuids)} UUIDs for {class_name}")
+                self._uuid_cache.setdefault(class_name, uuids)
+
+    # Occupations fetched per page when streaming for the ISCO join
+    _STREAM_PAGE_SIZE = 1000
+
+    # Arrow-backed strings keep relation CSV columns in one buffer
+    # instead of one Python str object per cell.
+    _STRING_DTYPE = "string[pyarrow]"
+
+    @staticmethod
+    def _uuid_column(values: pd.Series) -> pd.Series:
+        """Take the trailing path segment (the UUID) of every URI in a column."""
+        if values.dtype == RelationBuilder._STRING_DTYPE:
+            # Arrow-backed columns are split in Arrow compute; pandas'
+            # .str.rpartition would round-trip through Python strings.
+            uuids = pc.replace_substring_regex(
+                pa.array(values.array), pattern="^.*/", replacement=""
+            )
+            return pd.Series(
+                pd.arrays.ArrowStringArray(uuids),
+                index=values.index,
+                name=values.name,
+            )
+        return values.astype(str).str.rpartition("/")[2]
+
+    def _add_relation_refs(
+        self,
+        label: str,
+        from_class: str,
+        from_ids: pd.Series,
+        from_uuids: pd.Index,
+        to_class: str,
+        to_ids: pd.Series,
+        to_uuids: pd.Index,
+        ref_property: Union[str, np.ndarray],
+    ) -> None:
+        """
+        Keep relations whose endpoints both exist and batch-insert them.
+
+        Membership is tested column-wise against the UUID indexes; only
+        the surviving pairs are turned into reference dicts, which are
+        sent in chunks of ``refs_batch_size`` so upload starts before all
+        dicts exist.
+
+        Args:
+            label: Human-readable relation name for log messages
+            from_class: Source class name
+            from_ids: Source UUID per relation
+            from_uuids: UUIDs known to exist in the source class
+            to_class: Target class name
+            to_ids: Target UUID per relation
+            to_uuids: UUIDs known to exist in the target class
+            ref_property: Reference property name, or one per relation
+        """
+        mask = (from_uuids.get_indexer(from_ids) >= 0) & (to_uuids.get_indexer(to_ids) >= 0)
+        skipped = int(len(mask) - mask.sum())
+        sources = from_ids.to_numpy()[mask]
+        targets = to_ids.to_numpy()[mask]
+        if isinstance(ref_property, str):
+            props = [ref_property] * len(sources)
+        else:
+            props = ref_property[mask]
+
+        if len(sources):
+            logger.info(f"Batch-inserting {len(sources)} {label} references (skipped {skipped})")
+        for start in range(0, len(sources), self.refs_batch_size):
+            end = start + self.refs_batch_size
+            self.client.batch_add_references([
+                {
+                    "from_class": from_class, "from_uuid": source,
+                    "ref_property": prop,
+                    "to_class": to_class, "to_uuid": target,
+                }
+                for source, target, prop in zip(
+                    sources[start:end], targets[start:end], props[start:end]
+                )
+            ])
 
     def create_skill_relations(self) -> None:
         """Create occupation-skill relations."""
-        df = self.data_reader.read_csv("occupationSkillRelations_en.csv")
+        df = self.data_reader.read_csv(
+            "occupationSkillRelations_en.csv",
+            columns=["occupationUri", "skillUri", "relationType"],
+            dtype=self._STRING_DTYPE,
+        )
         if df is None or len(df) == 0:
             logger.warning("No occupation-skill relations found - skipping.")
             return
 
         logger.info("Creating occupation-skill relations...")
-        occupation_uuids = self._prefetch_uuids("Occupation")
-        skill_uuids = self._prefetch_uuids("Skill")
-
-        refs_batch = []
-        skipped = 0
-        for record in tqdm(df.to_dict("records"), desc="Occupation-Skill Relations", unit="rel"):
-            try:
-                occ_uuid = record["occupationUri"].split("/")[-1]
-                skill_uuid = record["skillUri"].split("/")[-1]
-                relation_type = record.get("relationType", "related")
-
-                if occ_uuid not in occupation_uuids or skill_uuid not in skill_uuids:
-                    skipped += 1
-                    continue
-
-                ref_prop = (
-                    "hasEssentialSkill" if relation_type == "essential"
-                    else "hasOptionalSkill" if relation_type == "optional"
-                    else "hasEssentialSkill"
-                )
-                refs_batch.append({
-                    "from_class": "Occupation", "from_uuid": occ_uuid,
-                    "ref_property": ref_prop,
-                    "to_class": "Skill", "to_uuid": skill_uuid,
-                })
-            except Exception as e:
-                logger.error(f"Failed to prepare occupation-skill relation: {e}")
-
-        if refs_batch:
-            logger.info(f"Batch-inserting {len(refs_batch)} occupation-skill references (skipped {skipped})")
-            self.client.batch_add_references(refs_batch)
+        occupation_uuids = self._uuid_index("Occupation")
+        skill_uuids = self._uuid_index("Skill")
+
+        # Only "optional" maps to hasOptionalSkill; anything else is essential
+        if "relationType" in df.columns:
+            is_optional = (df["relationType"] == "optional").fillna(False)
+            ref_props = np.where(
+                is_optional.to_numpy(dtype=bool),
+                "hasOptionalSkill", "hasEssentialSkill"
+            )
+        else:
+            ref_props = "hasEssentialSkill"
+
+        self._add_relation_refs(
+            "occupation-skill",
+            "Occupation", self._uuid_column(df["occupationUri"]), occupation_uuids,
+            "Skill", self._uuid_column(df["skillUri"]), skill_uuids,
+            ref_props,
+        )
         logger.info("Occupation-skill relations completed")
 
     def create_hierarchical_relations(self) -> None:
         """Create hierarchical relations between occupations."""
-        df = self.data_reader.read_csv("broaderRelationsOccPillar_en.csv")
+        df = self.data_reader.read_csv(
+            "broaderRelationsOccPillar_en.csv", dtype=self._STRING_DTYPE
+        )
         if df is None:
             return
 
@@ -96,64 +245,73 @@ class RelationBuilder:
             return
 
         logger.info("Creating hierarchical relations...")
-        occupation_uuids = self._prefetch_uuids("Occupation")
-
-        refs_batch = []
-        skipped = 0
-        for record in tqdm(df.to_dict("records"), desc="Hierarchical Relations", unit="rel"):
-            try:
-                broader_uuid = record["broaderUri"].split("/")[-1]
-                narrower_uuid = record["narrowerUri"].split("/")[-1]
-                if broader_uuid not in occupation_uuids or narrower_uuid not in occupation_uuids:
-                    skipped += 1
-                    continue
-                refs_batch.append({
-                    "from_class": "Occupation", "from_uuid": narrower_uuid,
-                    "ref_property": "broaderOccupation",
-                    "to_class": "Occupation", "to_uuid": broader_uuid,
-                })
-            except Exception as e:
-                logger.error(f"Failed to prepare hierarchical relation: {e}")
-
-        if refs_batch:
-            logger.info(f"Batch-inserting {len(refs_batch)} hierarchical references (skipped {skipped})")
-            self.client.batch_add_references(refs_batch)
+        occupation_uuids = self._uuid_index("Occupation")
+
+        self._add_relation_refs(
+            "hierarchical",
+            "Occupation", self._uuid_column(df["narrowerUri"]), occupation_uuids,
+            "Occupation", self._uuid_column(df["broaderUri"]), occupation_uuids,
+            "broaderOccupation",
+        )
         logger.info("Hierarchical relations completed")
 
     def create_isco_group_relations(self) -> None:
         """Create relations between occupations and ISCO groups."""
         logger.info("Creating ISCO group relations...")
         try:
-            isco_groups = self.client.get_objects(class_name="ISCOGroup")
-            isco_by_code = {}
-            for g in isco_groups:
-                code = g.get("code")
-                if code:
-                    isco_by_code[code] = g["_id"]
-
-            occupations = self.client.get_objects(class_name="Occupation")
-
-            refs_batch = []
-            for occ in tqdm(occupations, desc="ISCO Group Relations", unit="occ"):
-                isco_code = occ.get("iscoCode")
-                if not isco_code or isco_code not in isco_by_code:
-                    continue
-                refs_batch.append({
-                    "from_class": "Occupation", "from_uuid": occ["_id"],
-                    "ref_property": "memberOfISCOGroup",
-                    "to_class": "ISCOGroup", "to_uuid": isco_by_code[isco_code],
-                })
-
-            if refs_batch:
-                logger.info(f"Batch-inserting {len(refs_batch)} ISCO group references")
-                self.client.batch_add_references(refs_batch)
+            isco_df = pd.DataFrame(
+                self.client.get_objects(class_name="ISCOGroup", fields=["code"]),
+                columns=["code", "_id"],
+            )
+            # Empty codes never match; on duplicate codes the last group wins
+            isco_df = (
+                isco_df[isco_df["code"].fillna("") != ""]
+                .drop_duplicates("code", keep="last")
+            )
+
+            # Occupations are streamed page by page and each page is joined
+            # and flushed on its own, so references start uploading before
+            # every occupation has been fetched.
+            pending: List[Dict[str, Any]] = []
+            total = 0
+            # Only the occupation code is read. It starts with the ISCO
+            # unit group code (e.g. "2654.1.7" is in group "2654"); the
+            # Occupation class has no separate ISCO code property.
+            for page in self.client.get_objects_stream(
+                class_name="Occupation", fields=["code"],
+                batch_size=self._STREAM_PAGE_SIZE,
+            ):
+                occ_df = pd.DataFrame(page, columns=["_id", "code"]).dropna()
+                occ_df["iscoCode"] = occ_df["code"].str.partition(".")[0]
+                joined = occ_df[["_id", "iscoCode"]].merge(
+                    isco_df, left_on="iscoCode", right_on="code",
+                    suffixes=("_occ", "_isco"),
+                )
+                pending.extend(
+                    {
+                        "from_class": "Occupation", "from_uuid": occ_id,
+                        "ref_property": "memberOfISCOGroup",
+                        "to_class": "ISCOGroup", "to_uuid": isco_id,
+                    }
+                    for occ_id, isco_id in zip(joined["_id_occ"], joined["_id_isco"])
+                )
+                if len(pending) >= self.refs_batch_size:
+                    self.client.batch_add_references(pending)
+                    total += len(pending)
+                    pending = []
+            if pending:
+                self.client.batch_add_references(pending)
+                total += len(pending)
+
+            if total:
+                logger.info(f"Inserted {total} ISCO group references")
             logger.info("ISCO group relations completed")
         except Exception as e:
             logger.error(f"Error creating ISCO group relations: {e}")
 
     def create_skill_collection_relations(self) -> None:
         """Create relations between skills and skill collections."""
-        df = self.data_reader.read_csv("skillSkillRelations_en.csv")
+        df = self._read_shared_csv("skillSkillRelations_en.csv")
         if df is None or len(df) == 0:
             logger.warning("No skill collection relations found - skipping.")
             return
@@ -164,66 +322,43 @@ class RelationBuilder:
             return
 
         logger.info("Creating skill collection relations...")
-        collection_uuids = self._prefetch_uuids("SkillCollection")
-        skill_uuids = self._prefetch_uuids("Skill")
-
-        refs_batch = []
-        skipped = 0
-        for record in tqdm(df.to_dict("records"), desc="Skill Collection Relations", unit="rel"):
-            try:
-                coll_uuid = record["conceptSchemeUri"].split("/")[-1]
-                skill_uuid = record["skillUri"].split("/")[-1]
-                if coll_uuid not in collection_uuids or skill_uuid not in skill_uuids:
-                    skipped += 1
-                    continue
-                refs_batch.append({
-                    "from_class": "Skill", "from_uuid": skill_uuid,
-                    "ref_property": "memberOfSkillCollection",
-                    "to_class": "SkillCollection", "to_uuid": coll_uuid,
-                })
-            except Exception as e:
-                logger.error(f"Failed to prepare skill collection relation: {e}")
-
-        if refs_batch:
-            logger.info(f"Batch-inserting {len(refs_batch)} skill-collection references (skipped {skipped})")
-            self.client.batch_add_references(refs_batch)
+        collection_uuids = self._uuid_index("SkillCollection")
+        skill_uuids = self._uuid_index("Skill")
+
+        self._add_relation_refs(
+            "skill-collection",
+            "Skill", self._uuid_column(df["skillUri"]), skill_uuids,
+            "SkillCollection", self._uuid_column(df["conceptSchemeUri"]), collection_uuids,
+            "memberOfSkillCollection",
+        )
         logger.info("Skill collection relations completed")
 
     def create_skill_skill_relations(self) -> None:
         """Create skill-to-skill relations."""
-        df = self.data_reader.read_csv("skillSkillRelations_en.csv")
+        df = self._read_shared_csv("skillSkillRelations_en.csv")
         if df is None or len(df) == 0:
             logger.warning("No skill-skill relations found - skipping.")
             return
+        if "skillUri" not in df.columns or "relatedSkillUri" not in df.columns:
+            logger.warning("Required columns not found in skill-skill relations - skipping.")
+            return
 
         logger.info("Creating skill-skill relations...")
-        skill_uuids = self._prefetch_uuids("Skill")
-
-        refs_batch = []
-        skipped = 0
-        for record in tqdm(df.to_dict("records"), desc="Skill-Skill Relations", unit="rel"):
-            try:
-                skill_uuid = record["skillUri"].split("/")[-1]
-                related_uuid = record["relatedSkillUri"].split("/")[-1]
-                if skill_uuid not in skill_uuids or related_uuid not in skill_uuids:
-                    skipped += 1
-                    continue
-                refs_batch.append({
-                    "from_class": "Skill", "from_uuid": skill_uuid,
-                    "ref_property": "hasRelatedSkill",
-                    "to_class": "Skill", "to_uuid": related_uuid,
-                })
-            except Exception as e:
-                logger.error(f"Failed to prepare skill-skill relation: {e}")
-
-        if refs_batch:
-            logger.info(f"Batch-inserting {len(refs_batch)} skill-skill references (skipped {skipped})")
-            self.client.batch_add_references(refs_batch)
+        skill_uuids = self._uuid_index("Skill")
+
+        self._add_relation_refs(
+            "skill-skill",
+            "Skill", self._uuid_column(df["skillUri"]), skill_uuids,
+            "Skill", self._uuid_column(df["relatedSkillUri"]), skill_uuids,
+            "hasRelatedSkill",
+        )
         logger.info("Skill-skill relations completed")
 
     def create_broader_skill_relations(self) -> None:
         """Create broader skill relations."""
-        df = self.data_reader.read_csv("broaderRelationsSkillPillar_en.csv")
+        df = self.data_reader.read_csv(
+            "broaderRelationsSkillPillar_en.csv", dtype=self._STRING_DTYPE
+        )
         if df is None:
             return
 
@@ -236,26 +371,12 @@ class RelationBuilder:
             return
 
         logger.info("Creating broader skill relations...")
-        skill_uuids = self._prefetch_uuids("Skill")
-
-        refs_batch = []
-        skipped = 0
-        for record in tqdm(df.to_dict("records"), desc="Broader Skill Relations", unit="rel"):
-            try:
-                skill_uuid = record["conceptUri"].split("/")[-1]
-                broader_uuid = record["broaderUri"].split("/")[-1]
-                if skill_uuid not in skill_uuids or broader_uuid not in skill_uuids:
-                    skipped += 1
-                    continue
-                refs_batch.append({
-                    "from_class": "Skill", "from_uuid": skill_uuid,
-                    "ref_property": "broaderSkill",
-                    "to_class": "Skill", "to_uuid": broader_uuid,
-                })
-            except Exception as e:
-                logger.error(f"Failed to prepare broader skill relation: {e}")
-
-        if refs_batch:
-            logger.info(f"Batch-inserting {len(refs_batch)} broader-skill references (skipped {skipped})")
-            self.client.batch_add_references(refs_batch)
+        skill_uuids = self._uuid_index("Skill")
+
+        self._add_relation_refs(
+            "broader-skill",
+            "Skill", self._uuid_column(df["conceptUri"]), skill_uuids,
+            "Skill", self._uuid_column(df["broaderUri"]), skill_uuids,
+            "broaderSkill",
+        )
         logger.info("Broader skill relations completed")
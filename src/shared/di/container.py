@@ -5,9 +5,10 @@ This module provides the dependency injection container that manages
 service resolution and lifecycle.
 """
 
+import functools
 import inspect
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union, get_type_hints
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union, get_type_hints
 
 from .lifetime_manager import LifetimeManager
 from .service_registry import ServiceLifetime, ServiceRegistration, ServiceRegistry
@@ -15,6 +16,34 @@ from .service_registry import ServiceLifetime, ServiceRegistration, ServiceRegis
 T = TypeVar('T')
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_ctor_meta(implementation_type: Type) -> Tuple[Tuple[str, Type], ...]:
+    """
+    Return the injectable constructor parameters of a type.
+
+    inspect.signature and get_type_hints are slow and a class's
+    constructor never changes, so the result is computed once per type.
+
+    Args:
+        implementation_type: Type whose constructor is inspected
+
+    Returns:
+        Tuple[Tuple[str, Type], ...]: (parameter name, annotated type) pairs,
+        excluding 'self' and unannotated parameters
+    """
+    constructor = implementation_type.__init__
+    signature = inspect.signature(constructor)
+    type_hints = get_type_hints(constructor)
+
+    # Skip 'self' parameter
+    parameters = list(signature.parameters.keys())[1:]
+    return tuple(
+        (param, type_hints[param])
+        for param in parameters
+        if type_hints.get(param)
+    )
+
+
 class Container:
     """
     Dependency injection container.
@@ -213,19 +242,11 @@ class Container:
         Returns:
             Any: Created instance
         """
-        constructor = implementation_type.__init__
-        signature = inspect.signature(constructor)
-        type_hints = get_type_hints(constructor)
-        
-        # Skip 'self' parameter
-        parameters = list(signature.parameters.keys())[1:]
-        
         # Resolve dependencies
-        dependencies = {}
-        for param in parameters:
-            param_type = type_hints.get(param)
-            if param_type:
-                dependencies[param] = self.resolve(param_type)
+        dependencies = {
+            param: self.resolve(param_type)
+            for param, param_type in _resolve_ctor_meta(implementation_type)
+        }
         
         # Create instance
         instance = implementation_type(**dependencies)
@@ -328,9 +328,11 @@ def with_recovery(
                         try:
                             return await strategy.recover(e, context)
                         except Exception as recovery_error:
-                            # Update context with recovery error
+                            # Update context with recovery error; merging keeps
+                            # only the original stack trace, so don't format one
                             recovery_context = ErrorContextManager.create_context(
                                 recovery_error,
+                                include_stack_trace=False,
                                 recovery_attempted=True,
                                 recovery_successful=False,
                                 recovery_strategy=strategy.__class__.__name__
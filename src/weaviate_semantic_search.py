@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from sentence_transformers import SentenceTransformer
 from src.shared.logging.structured_logger import configure_logging
 from src.infrastructure.database.weaviate.weaviate_client import WeaviateClient
+from src.infrastructure.external.batching_encoder import BatchingEncoder
+from src.infrastructure.external.semantic_cache import SemanticQueryCache
 import torch
 import numpy as np
 import json
@@ -12,6 +14,23 @@ import yaml
 
 logger = configure_logging()
 
+_SEMANTIC_MATCH = {"match_type": "semantic"}
+_NO_ADDITIONAL: Dict[str, Any] = {}  # shared read-only default, never mutated
+
+
+def _annotate_semantic_matches(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Tag near-vector results with match type and similarity score in place.
+
+    A single ``dict.update`` per row merges both keys in C instead of two
+    separate item assignments.
+    """
+    for row in rows:
+        row.update(
+            _SEMANTIC_MATCH,
+            similarity_score=(row.get("_additional") or _NO_ADDITIONAL).get("certainty", 0),
+        )
+    return rows
+
 @dataclass
 class TaxonomyEnrichmentResult:
     """Structured result for taxonomy enrichment"""
@@ -120,10 +139,29 @@ class VaritySemanticSearch:
         embedding_model = profile_config.get("model", {}).get(
             "embedding_model", "sentence-transformers/multi-qa-MiniLM-L6-cos-v1"
         )
-        self.model = SentenceTransformer(embedding_model, device=self._get_device())
+        device = self._get_device()
+        self.model = SentenceTransformer(embedding_model, device=device)
+        if device in ("cuda", "mps"):
+            self.model.half()
         self.embedding_model_name = embedding_model
         self.job_processor = JobPostingProcessor()
 
+        # Concurrent request threads share one batched model call
+        self.query_encoder = BatchingEncoder(
+            lambda texts: self.model.encode(
+                texts, normalize_embeddings=True, batch_size=len(texts)
+            ),
+            max_batch_size=int(os.getenv("EMBED_BATCH_MAX", "32")),
+            max_wait_ms=float(os.getenv("EMBED_BATCH_WAIT_MS", "5")),
+        )
+
+        # Near-duplicate queries reuse recent results instead of re-querying
+        self.query_cache = SemanticQueryCache(
+            threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95")),
+            ttl_seconds=float(os.getenv("SEMANTIC_CACHE_TTL", "300")),
+            max_entries=int(os.getenv("SEMANTIC_CACHE_SIZE", "1024")),
+        )
+
         # Initialize repositories
         self.skill_repo = self.client.get_repository("Skill")
         self.occupation_repo = self.client.get_repository("Occupation")
@@ -254,8 +292,12 @@ class VaritySemanticSearch:
                                  similarity_threshold: float = 0.7) -> List[Dict[str, Any]]:
         """Search for occupations using semantic similarity"""
         try:
-            # Generate query embedding
-            query_embedding = self.model.encode(query_text).tolist()
+            # Generate query embedding (batched with concurrent requests)
+            query_embedding = self.query_encoder.encode(query_text)
+            cache_key = ("Occupation", limit, similarity_threshold)
+            cached = self.query_cache.get(cache_key, query_embedding)
+            if cached is not None:
+                return cached
             
             # Search for occupations
             result = (
@@ -265,7 +307,7 @@ class VaritySemanticSearch:
                     "definition_en", "code", "altLabels_en"
                 ])
                 .with_near_vector({
-                    "vector": query_embedding,
+                    "vector": query_embedding.tolist(),
                     "certainty": similarity_threshold
                 })
                 .with_limit(limit)
@@ -273,13 +315,10 @@ class VaritySemanticSearch:
                 .do()
             )
             
-            occupations = result.get("data", {}).get("Get", {}).get("Occupation", [])
-            
-            # Enrich with additional metadata
-            for occupation in occupations:
-                occupation["match_type"] = "semantic"
-                occupation["similarity_score"] = occupation.get("_additional", {}).get("certainty", 0)
-            
+            occupations = _annotate_semantic_matches(
+                result.get("data", {}).get("Get", {}).get("Occupation", [])
+            )
+            self.query_cache.put(cache_key, query_embedding, occupations)
             return occupations
             
         except Exception as e:
@@ -290,8 +329,21 @@ class VaritySemanticSearch:
                             similarity_threshold: float = 0.6) -> List[Dict[str, Any]]:
         """Search for skills using semantic similarity"""
         try:
-            # Generate query embedding
-            query_embedding = self.model.encode(query_text).tolist()
+            # Generate query embedding (batched with concurrent requests)
+            query_embedding = self.query_encoder.encode(query_text)
+        except Exception as e:
+            logger.error(f"Error searching skills: {str(e)}")
+            return []
+        return self._search_skills_by_vector(query_embedding, limit, similarity_threshold)
+
+    def _search_skills_by_vector(self, query_embedding: np.ndarray, limit: int,
+                                 similarity_threshold: float) -> List[Dict[str, Any]]:
+        """Search for skills near an already computed query embedding"""
+        try:
+            cache_key = ("Skill", limit, similarity_threshold)
+            cached = self.query_cache.get(cache_key, query_embedding)
+            if cached is not None:
+                return cached
             
             # Search for skills
             result = (
@@ -301,7 +353,7 @@ class VaritySemanticSearch:
                     "skillType", "reuseLevel", "altLabels_en"
                 ])
                 .with_near_vector({
-                    "vector": query_embedding,
+                    "vector": query_embedding.tolist(),
                     "certainty": similarity_threshold
                 })
                 .with_limit(limit)
@@ -309,13 +361,10 @@ class VaritySemanticSearch:
                 .do()
             )
             
-            skills = result.get("data", {}).get("Get", {}).get("Skill", [])
-            
-            # Enrich with additional metadata
-            for skill in skills:
-                skill["match_type"] = "semantic"
-                skill["similarity_score"] = skill.get("_additional", {}).get("certainty", 0)
-            
+            skills = _annotate_semantic_matches(
+                result.get("data", {}).get("Get", {}).get("Skill", [])
+            )
+            self.query_cache.put(cache_key, query_embedding, skills)
             return skills
             
         except Exception as e:
@@ -458,9 +507,16 @@ class VaritySemanticSearch:
         all_skills = []
         skill_confidences = {}
         
-        # Search for skills based on extracted text
-        for skill_text in extracted_text_skills[:10]:  # Limit to avoid too many API calls
-            found_skills = self.search_skills_by_text(skill_text, limit=3, similarity_threshold=0.5)
+        # Search for skills based on extracted text; the texts are
+        # embedded in one model call rather than one call per skill
+        skill_texts = extracted_text_skills[:10]  # Limit to avoid too many API calls
+        try:
+            skill_embeddings = self.query_encoder.encode_many(skill_texts) if skill_texts else []
+        except Exception as e:
+            logger.error(f"Error searching skills: {str(e)}")
+            skill_embeddings = []
+        for skill_embedding in skill_embeddings:
+            found_skills = self._search_skills_by_vector(skill_embedding, limit=3, similarity_threshold=0.5)
             for skill in found_skills:
                 skill_uri = skill["conceptUri"]
                 if skill_uri not in skill_confidences:
@@ -73,6 +73,9 @@ def mock_weaviate_client():
     # set_ingestion_metadata is a no-op in tests
     client.set_ingestion_metadata.return_value = None
 
+    # No checkpoint from a previous interrupted run
+    client.get_ingestion_checkpoint.return_value = []
+
     # check_object_exists
     client.check_object_exists.return_value = False
 
@@ -0,0 +1,51 @@
+"""
+Tests for EntityIngestor's background uploads.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from src.infrastructure.ingestion.entity_ingestor import EntityIngestor
+
+
+@pytest.fixture
+def ingestor(mock_weaviate_client):
+    """EntityIngestor with a mocked client and data reader."""
+    ingestor = EntityIngestor(mock_weaviate_client, Mock())
+    yield ingestor
+    ingestor.close()
+
+
+class TestEntityIngestorUploads:
+    """Test suite for the upload queue and worker thread."""
+
+    def test_uploads_reach_the_client(self, ingestor, mock_weaviate_client):
+        """Queued batches are uploaded before _wait_for_uploads returns."""
+        ingestor._upload("Skill", [{"uri": "s1"}], ["u1"])
+        ingestor._wait_for_uploads()
+
+        mock_weaviate_client.batch_add_objects.assert_called_once_with(
+            "Skill", [{"uri": "s1"}], ["u1"]
+        )
+
+    def test_upload_failure_is_reraised(self, ingestor, mock_weaviate_client):
+        """A failed background upload is raised by _wait_for_uploads, once."""
+        mock_weaviate_client.batch_add_objects.side_effect = RuntimeError("batch rejected")
+        ingestor._upload("Skill", [{"uri": "s1"}])
+
+        with pytest.raises(RuntimeError, match="batch rejected"):
+            ingestor._wait_for_uploads()
+        ingestor._wait_for_uploads()
+
+    def test_close_stops_upload_thread(self, ingestor):
+        """close() lets the worker exit and a later upload starts a new one."""
+        ingestor._upload("Skill", [{"uri": "s1"}])
+        thread = ingestor._upload_thread
+
+        ingestor.close()
+
+        assert not thread.is_alive()
+        assert ingestor._upload_thread is None
+        ingestor._upload("Skill", [{"uri": "s2"}])
+        ingestor._wait_for_uploads()
+        assert ingestor._upload_thread.is_alive()
@@ -0,0 +1,73 @@
+"""
+Tests for ESCODataReader column standardization.
+
+The relation builder relies on these helpers keeping Arrow-backed string
+columns Arrow-backed.
+"""
+
+import pandas as pd
+
+from src.infrastructure.ingestion.esco_data_reader import ESCODataReader
+
+ARROW_STRING = "string[pyarrow]"
+BASE = "http://data.europa.eu/esco/skill/"
+
+
+class TestStandardizeColumns:
+    """Test suite for the standardize_* helpers."""
+
+    def test_collection_rename_keeps_arrow_dtype(self):
+        """Renamed collection columns keep their string[pyarrow] dtype."""
+        df = pd.DataFrame(
+            {
+                "collectionUri": [BASE + "c1", BASE + "c2"],
+                "conceptUri": [BASE + "s1", BASE + "s2"],
+            },
+            dtype=ARROW_STRING,
+        )
+
+        out = ESCODataReader.standardize_collection_relation_columns(df)
+
+        assert list(out.columns) == ["conceptSchemeUri", "skillUri"]
+        assert out["skillUri"].dtype == ARROW_STRING
+        assert out["conceptSchemeUri"].dtype == ARROW_STRING
+
+    def test_level_uri_hierarchy_keeps_arrow_dtype(self):
+        """Broader/narrower columns built from Level URIs stay Arrow-backed."""
+        df = pd.DataFrame(
+            {
+                "Level 0 URI": [BASE + "a", BASE + "a"],
+                "Level 1 URI": [BASE + "b", None],
+                "Level 2 URI": [BASE + "c", None],
+            },
+            dtype=ARROW_STRING,
+        )
+
+        out = ESCODataReader.standardize_hierarchy_columns(df)
+
+        # The second row has no broader/narrower pair and is dropped
+        assert len(out) == 1
+        assert out["broaderUri"].iloc[0] == BASE + "b"
+        assert out["narrowerUri"].iloc[0] == BASE + "c"
+        assert out["broaderUri"].dtype == ARROW_STRING
+        assert out["narrowerUri"].dtype == ARROW_STRING
+
+
+class TestReadCsv:
+    """Test suite for ESCODataReader.read_csv."""
+
+    def test_reads_quoted_field_with_embedded_newline(self, tmp_path):
+        """Multi-line quoted fields, as in occupations_en.csv, are parsed."""
+        # PyArrow parses in blocks (1 MB by default) and only fails when a
+        # quoted newline falls past the first block, so the file is large.
+        rows = 20000
+        with open(tmp_path / "occupations_en.csv", "w") as f:
+            f.write("conceptUri,preferredLabel,altLabels\n")
+            for i in range(rows):
+                f.write(f'{BASE}o{i},occupation {i},"head of {i}\nmanager of {i}"\n')
+
+        df = ESCODataReader(str(tmp_path)).read_csv("occupations_en.csv", dtype=ARROW_STRING)
+
+        assert len(df) == rows
+        assert df["altLabels"].iloc[-1] == f"head of {rows - 1}\nmanager of {rows - 1}"
+        assert df["conceptUri"].dtype == ARROW_STRING
@@ -0,0 +1,140 @@
+"""
+Tests for the ingestion orchestrator's step plan.
+
+The entity ingestor and relation builder are mocked, so these tests cover
+scheduling only: dependency order, checkpoint resume, and failure handling.
+"""
+
+import threading
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.infrastructure.ingestion import ingestion_orchestrator
+from src.infrastructure.ingestion.ingestion_orchestrator import IngestionOrchestrator
+
+
+@pytest.fixture
+def step_calls():
+    """Names of the steps whose function ran, in completion order."""
+    return []
+
+
+@pytest.fixture
+def orchestrator(mock_weaviate_client, step_calls):
+    """Orchestrator whose data reader, ingestor and builder are mocks."""
+    entity_ingestor = MagicMock()
+    relation_builder = MagicMock()
+    lock = threading.Lock()
+
+    def record(name):
+        def call(*args, **kwargs):
+            with lock:
+                step_calls.append(name)
+        return call
+
+    mock_weaviate_client.ensure_schema.side_effect = record("ensure_schema")
+    for name in (
+        "ingest_isco_groups", "ingest_occupations", "ingest_skills",
+        "ingest_skill_groups", "ingest_skill_collections",
+    ):
+        getattr(entity_ingestor, name).side_effect = record(name)
+    relation_builder.prefetch_all.side_effect = record("prefetch_uuids")
+    for name in (
+        "create_skill_relations", "create_hierarchical_relations",
+        "create_isco_group_relations", "create_skill_collection_relations",
+        "create_skill_skill_relations", "create_broader_skill_relations",
+    ):
+        getattr(relation_builder, name).side_effect = record(name)
+
+    with patch.object(ingestion_orchestrator, "ESCODataReader"), \
+            patch.object(ingestion_orchestrator, "EntityIngestor", return_value=entity_ingestor), \
+            patch.object(ingestion_orchestrator, "RelationBuilder", return_value=relation_builder):
+        orch = IngestionOrchestrator(mock_weaviate_client, data_dir="test_data")
+        orch.entity_ingestor = entity_ingestor
+        orch.relation_builder = relation_builder
+        yield orch
+
+
+def _plan(orch):
+    """Return the orchestrator's steps keyed by name."""
+    steps = orch._build_plan(orch.entity_ingestor, orch.relation_builder)
+    return {step.name: step for step in steps}
+
+
+class TestIngestionOrchestrator:
+    """Test suite for IngestionOrchestrator.run_complete_ingestion."""
+
+    def test_steps_run_after_their_dependencies(self, orchestrator, step_calls):
+        """Every step runs once, after all of the steps it depends on."""
+        results = orchestrator.run_complete_ingestion()
+
+        plan = _plan(orchestrator)
+        assert sorted(step_calls) == sorted(plan)
+        position = {name: idx for idx, name in enumerate(step_calls)}
+        for step in plan.values():
+            for dep in step.depends_on:
+                assert position[dep] < position[step.name], f"{step.name} ran before {dep}"
+        assert set(results.values()) == {"completed"}
+        orchestrator.entity_ingestor.close.assert_called_once_with()
+
+    def test_prefetch_runs_between_entity_and_relation_steps(self, orchestrator, step_calls):
+        """UUIDs are prefetched after entity ingestion and before any relation step."""
+        orchestrator.run_complete_ingestion()
+
+        prefetch = step_calls.index("prefetch_uuids")
+        assert all(step_calls.index(n) < prefetch for n in step_calls if n.startswith("ingest_"))
+        assert all(step_calls.index(n) > prefetch for n in step_calls if n.startswith("create_"))
+
+    def test_completed_steps_are_skipped_on_resume(
+        self, orchestrator, step_calls, mock_weaviate_client
+    ):
+        """Steps recorded in the checkpoint are not run again."""
+        mock_weaviate_client.get_ingestion_checkpoint.return_value = [
+            "ensure_schema", "ingest_isco_groups", "ingest_occupations",
+        ]
+
+        results = orchestrator.run_complete_ingestion()
+
+        assert "ensure_schema" not in step_calls
+        assert "ingest_isco_groups" not in step_calls
+        assert "ingest_occupations" not in step_calls
+        assert results["ingest_occupations"] == "skipped"
+        assert results["ingest_skills"] == "completed"
+        # The checkpoint is cleared once the pipeline finishes
+        mock_weaviate_client.set_ingestion_checkpoint.assert_called_with([])
+
+    def test_force_ignores_checkpoint(self, orchestrator, step_calls, mock_weaviate_client):
+        """With force set, every step runs despite an existing checkpoint."""
+        mock_weaviate_client.get_ingestion_checkpoint.return_value = ["ensure_schema"]
+        orchestrator.force = True
+
+        orchestrator.run_complete_ingestion()
+
+        assert "ensure_schema" in step_calls
+        mock_weaviate_client.get_ingestion_checkpoint.assert_not_called()
+
+    def test_failed_step_blocks_dependents(
+        self, orchestrator, step_calls, mock_weaviate_client
+    ):
+        """A failing step stops everything that depends on it and is re-raised."""
+        orchestrator.entity_ingestor.ingest_skills.side_effect = RuntimeError("upload failed")
+
+        with pytest.raises(RuntimeError, match="upload failed"):
+            orchestrator.run_complete_ingestion()
+
+        assert step_calls == ["ensure_schema", "ingest_isco_groups", "ingest_occupations"]
+        checkpoints = [c.args[0] for c in mock_weaviate_client.set_ingestion_checkpoint.call_args_list]
+        # Completed steps stay checkpointed for the next run to resume from
+        assert checkpoints[-1] == ["ensure_schema", "ingest_isco_groups", "ingest_occupations"]
+        orchestrator.entity_ingestor.close.assert_called_once_with()
+
+    def test_plan_with_cycle_is_rejected(self):
+        """A dependency cycle is reported instead of hanging."""
+        steps = [
+            ingestion_orchestrator.Step("a", lambda: None, ("b",)),
+            ingestion_orchestrator.Step("b", lambda: None, ("a",)),
+        ]
+
+        with pytest.raises(ValueError, match="cycle"):
+            IngestionOrchestrator._topological_order(steps)
@@ -0,0 +1,120 @@
+"""
+Tests for the semantic search result cache.
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from src.infrastructure.external import semantic_cache
+from src.infrastructure.external.semantic_cache import SemanticQueryCache
+
+NS = ("Skill", 10, 0.5)
+
+
+def _unit(vector):
+    vector = np.asarray(vector, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _near(base, cosine, seed=0):
+    """Return a unit vector with the given cosine similarity to base."""
+    base = _unit(base)
+    other = np.random.default_rng(seed).standard_normal(base.shape[0]).astype(np.float32)
+    other = _unit(other - (other @ base) * base)
+    return cosine * base + np.sqrt(1 - cosine ** 2) * other
+
+
+@pytest.fixture
+def base():
+    """A fixed query embedding."""
+    return _unit(np.random.default_rng(42).standard_normal(64))
+
+
+class TestSemanticQueryCache:
+    """Test suite for SemanticQueryCache."""
+
+    def test_near_duplicate_query_hits(self, base):
+        """A query above the similarity threshold reuses cached results."""
+        cache = SemanticQueryCache(threshold=0.95)
+        cache.put(NS, base, [{"conceptUri": "a"}])
+
+        assert cache.get(NS, _near(base, 0.99)) == [{"conceptUri": "a"}]
+
+    def test_query_below_threshold_misses(self, base):
+        """A query below the similarity threshold is a miss."""
+        cache = SemanticQueryCache(threshold=0.95)
+        cache.put(NS, base, [{"conceptUri": "a"}])
+
+        assert cache.get(NS, _near(base, 0.9)) is None
+
+    def test_namespaces_do_not_mix(self, base):
+        """Results cached for other search parameters are never returned."""
+        cache = SemanticQueryCache()
+        cache.put(NS, base, [{"conceptUri": "a"}])
+
+        assert cache.get(("Skill", 20, 0.5), base) is None
+
+    def test_best_match_wins(self, base):
+        """The most similar cached query above the threshold is returned."""
+        cache = SemanticQueryCache(threshold=0.9)
+        cache.put(NS, _near(base, 0.92, seed=1), [{"conceptUri": "far"}])
+        cache.put(NS, _near(base, 0.99, seed=2), [{"conceptUri": "close"}])
+
+        assert cache.get(NS, base) == [{"conceptUri": "close"}]
+
+    def test_entries_expire_after_ttl(self, base):
+        """Entries are not returned once their TTL has passed."""
+        cache = SemanticQueryCache(ttl_seconds=10)
+        with patch.object(semantic_cache.time, "monotonic", return_value=100.0):
+            cache.put(NS, base, [{"conceptUri": "a"}])
+        with patch.object(semantic_cache.time, "monotonic", return_value=109.0):
+            assert cache.get(NS, base) is not None
+        with patch.object(semantic_cache.time, "monotonic", return_value=111.0):
+            assert cache.get(NS, base) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Beyond max_entries the least recently used entry is dropped."""
+        cache = SemanticQueryCache(max_entries=2)
+        first, second, third = np.eye(3, dtype=np.float32)
+        cache.put(NS, first, [{"n": 1}])
+        cache.put(NS, second, [{"n": 2}])
+        # Touch the first entry so the second becomes least recently used
+        assert cache.get(NS, first) == [{"n": 1}]
+        cache.put(NS, third, [{"n": 3}])
+
+        assert len(cache) == 2
+        assert cache.get(NS, second) is None
+        assert cache.get(NS, first) == [{"n": 1}]
+        assert cache.get(NS, third) == [{"n": 3}]
+
+    def test_results_are_copied(self, base):
+        """Neither the stored nor the returned rows alias the caller's dicts."""
+        cache = SemanticQueryCache()
+        rows = [{"conceptUri": "a"}]
+        cache.put(NS, base, rows)
+        rows[0]["conceptUri"] = "changed"
+
+        hit = cache.get(NS, base)
+        assert hit == [{"conceptUri": "a"}]
+        hit[0]["similarity_score"] = 1.0
+        assert cache.get(NS, base) == [{"conceptUri": "a"}]
+
+    def test_lsh_lookup_finds_near_duplicate(self, base):
+        """Namespaces past linear_scan_limit still find near-duplicates via LSH."""
+        cache = SemanticQueryCache(threshold=0.95, linear_scan_limit=4, max_entries=100)
+        rng = np.random.default_rng(7)
+        for i in range(20):
+            cache.put(NS, rng.standard_normal(64), [{"n": i}])
+        cache.put(NS, base, [{"conceptUri": "a"}])
+
+        assert cache.get(NS, _near(base, 0.999)) == [{"conceptUri": "a"}]
+
+    def test_zero_size_disables_cache(self, base):
+        """max_entries=0 turns put and get into no-ops."""
+        cache = SemanticQueryCache(max_entries=0)
+        cache.put(NS, base, [{"conceptUri": "a"}])
+
+        assert len(cache) == 0
+        assert cache.get(NS, base) is None
@@ -0,0 +1,32 @@
+"""
+Tests for WeaviateClient construction.
+"""
+
+from unittest.mock import patch
+
+from src.infrastructure.database.weaviate import weaviate_client
+from src.infrastructure.database.weaviate.weaviate_client import WeaviateClient
+
+
+class TestWeaviateClientTransport:
+    """Test suite for the WEAVIATE_TRANSPORT option."""
+
+    def test_grpc_transport_configures_grpc_port(self, monkeypatch):
+        """WEAVIATE_TRANSPORT=grpc passes the gRPC port to the v3 client."""
+        monkeypatch.setenv("WEAVIATE_TRANSPORT", "grpc")
+        monkeypatch.setenv("WEAVIATE_GRPC_PORT", "50052")
+
+        with patch.object(weaviate_client, "Client") as client_cls:
+            WeaviateClient(url="http://test:8080")
+
+        config = client_cls.call_args.kwargs["additional_config"]
+        assert config.grpc_port_experimental == 50052
+
+    def test_rest_transport_is_the_default(self, monkeypatch):
+        """Without WEAVIATE_TRANSPORT no additional config is passed."""
+        monkeypatch.delenv("WEAVIATE_TRANSPORT", raising=False)
+
+        with patch.object(weaviate_client, "Client") as client_cls:
+            WeaviateClient(url="http://test:8080")
+
+        assert client_cls.call_args.kwargs["additional_config"] is None